@@ -0,0 +1 @@
+"""Microbenchmarks and synthetic data for the CAB harness (not installed)."""
@@ -0,0 +1,334 @@
+"""
+Microbenchmarks for the CAB harness on synthetic datasets.
+
+Each benchmark is timed over ``--repeat`` runs (min and median seconds)
+and run once more under tracemalloc for peak memory. Results are written
+as JSON; with ``--baseline`` the run is compared against an earlier file
+and exits non-zero when any benchmark slows down or grows past the limit.
+
+Usage:
+    python -m benchmarks.run --sizes 1000,10000,100000 -o bench.json
+    python -m benchmarks.run --sizes 1000000 --only load_dataset,aggregate_scores
+    python -m benchmarks.run -o new.json --baseline bench.json --max-slowdown 1.5
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from cab_benchmark.aggregator import aggregate_scores, compare_models
+from cab_benchmark.loader import filter_questions, get_statistics, load_dataset
+from cab_benchmark.scorer import ObjectiveScorer, SubjectiveScorer
+
+from .synthetic import generate_dataset, generate_results, judge_response
+
+# Comparison uses fewer resamples than the CLI default so large sizes finish
+COMPARE_RESAMPLES = 1000
+COMPARE_MODELS = 3
+
+
+class Fixture:
+    """Synthetic inputs for one size, built lazily and shared by benchmarks."""
+
+    def __init__(self, size: int, seed: int, workdir: str):
+        self.size = size
+        self.seed = seed
+        self.workdir = workdir
+        self._cache = {}
+
+    def _get(self, key: str, build: Callable):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    @property
+    def dataset(self) -> Dict:
+        return self._get("dataset", lambda: generate_dataset(self.size, seed=self.seed))
+
+    @property
+    def dataset_path(self) -> str:
+        def build():
+            path = os.path.join(self.workdir, f"dataset_{self.size}.json")
+            with open(path, "w") as f:
+                json.dump(self.dataset, f)
+            return path
+        return self._get("dataset_path", build)
+
+    @property
+    def objective(self) -> List[Dict]:
+        return self._get("objective", lambda: [
+            q for q in self.dataset["questions"] if q["scoring_mode"] == "objective"
+        ])
+
+    @property
+    def presented(self) -> List[tuple]:
+        """(question, metadata, response) for every objective question."""
+        def build():
+            scorer = ObjectiveScorer(seed=self.seed)
+            rng = random.Random(self.seed)
+            out = []
+            for q in self.objective:
+                _, meta = scorer.prepare_question(q)
+                out.append((q, meta, f"The answer is {rng.choice('ABCD')}."))
+            return out
+        return self._get("presented", build)
+
+    @property
+    def judge_responses(self) -> List[str]:
+        def build():
+            rng = random.Random(self.seed)
+            return [judge_response(rng, rng.randint(1, 5)) for _ in range(self.size)]
+        return self._get("judge_responses", build)
+
+    @property
+    def runs(self) -> Dict[str, Dict]:
+        return self._get("runs", lambda: {
+            f"model-{i}": generate_results(
+                self.dataset["questions"], seed=self.seed + i, skill=0.5 + 0.1 * i, model=f"model-{i}"
+            )
+            for i in range(COMPARE_MODELS)
+        })
+
+
+def bench_load_dataset(fx: Fixture) -> Callable:
+    path = fx.dataset_path
+    return lambda: load_dataset(path)
+
+
+def bench_filter_questions(fx: Fixture) -> Callable:
+    questions = fx.dataset["questions"]
+    return lambda: filter_questions(
+        questions,
+        dimensions=["Biblical Literacy", "Pastoral Care", "Apologetics"],
+        traditions=["Catholic", "Baptist", "Cross-Tradition"],
+        scoring_mode="objective",
+    )
+
+
+def bench_get_statistics(fx: Fixture) -> Callable:
+    data = fx.dataset
+    return lambda: get_statistics(data)
+
+
+def bench_prepare_question(fx: Fixture) -> Callable:
+    scorer = ObjectiveScorer(seed=fx.seed)
+    questions = fx.objective
+
+    def run():
+        for q in questions:
+            scorer.prepare_question(q)
+    return run
+
+
+def bench_objective_score(fx: Fixture) -> Callable:
+    scorer = ObjectiveScorer(seed=fx.seed)
+    presented = fx.presented
+
+    def run():
+        for q, meta, response in presented:
+            scorer.score(q, response, meta)
+    return run
+
+
+def bench_parse_judge_response(fx: Fixture) -> Callable:
+    scorer = SubjectiveScorer(judge_client=None)
+    responses = fx.judge_responses
+
+    def run():
+        for response in responses:
+            scorer._parse_judge_response(response)
+    return run
+
+
+def bench_aggregate_scores(fx: Fixture) -> Callable:
+    results = fx.runs["model-0"]["detailed_results"]
+    return lambda: aggregate_scores(results)
+
+
+def bench_compare_models(fx: Fixture) -> Callable:
+    runs = fx.runs
+    summaries = {name: run["summary"] for name, run in runs.items()}
+    detailed = {name: run["detailed_results"] for name, run in runs.items()}
+    return lambda: compare_models(
+        summaries,
+        detailed,
+        n_permutations=COMPARE_RESAMPLES,
+        n_bootstrap=COMPARE_RESAMPLES,
+        seed=0,
+    )
+
+
+BENCHMARKS = {
+    "load_dataset": bench_load_dataset,
+    "filter_questions": bench_filter_questions,
+    "get_statistics": bench_get_statistics,
+    "prepare_question": bench_prepare_question,
+    "objective_score": bench_objective_score,
+    "parse_judge_response": bench_parse_judge_response,
+    "aggregate_scores": bench_aggregate_scores,
+    "compare_models": bench_compare_models,
+}
+
+
+def measure(fn: Callable, repeat: int) -> Dict:
+    """Time ``fn`` over ``repeat`` runs, then measure its peak traced memory."""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds_min": min(times),
+        "seconds_median": statistics.median(times),
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_benchmarks(
+    sizes: List[int],
+    names: Optional[List[str]] = None,
+    repeat: int = 3,
+    seed: int = 0,
+    verbose: bool = True,
+) -> Dict:
+    """
+    Run benchmarks at each size.
+
+    Args:
+        sizes: Dataset sizes (questions)
+        names: Benchmarks to run (all by default)
+        repeat: Timed runs per benchmark
+        seed: Seed for the synthetic data
+        verbose: Print each measurement as it completes
+
+    Returns:
+        Dictionary with environment info and one record per (benchmark, size)
+    """
+    names = names or list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {sorted(unknown)}")
+
+    records = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            fx = Fixture(size, seed, workdir)
+            for name in names:
+                fn = BENCHMARKS[name](fx)
+                record = {"name": name, "size": size, "repeat": repeat}
+                record.update(measure(fn, repeat))
+                record["us_per_question"] = record["seconds_min"] / size * 1e6
+                records.append(record)
+                if verbose:
+                    print(
+                        f"{name:22s} n={size:<8d} min={record['seconds_min']:.4f}s "
+                        f"median={record['seconds_median']:.4f}s "
+                        f"peak={record['peak_memory_bytes'] / 2**20:.1f}MiB",
+                        file=sys.stderr,
+                    )
+            del fx
+            gc.collect()
+
+    return {
+        "environment": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "seed": seed,
+            "compare_resamples": COMPARE_RESAMPLES,
+        },
+        "results": records,
+    }
+
+
+def find_regressions(current: Dict, baseline: Dict, max_slowdown: float = 1.5) -> List[Dict]:
+    """
+    Benchmarks whose min time or peak memory grew past ``max_slowdown`` times.
+
+    Only (benchmark, size) pairs present in both runs are compared.
+    """
+    previous = {(r["name"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for r in current["results"]:
+        before = previous.get((r["name"], r["size"]))
+        if before is None:
+            continue
+        for metric in ("seconds_min", "peak_memory_bytes"):
+            if before[metric] and r[metric] / before[metric] > max_slowdown:
+                regressions.append({
+                    "name": r["name"],
+                    "size": r["size"],
+                    "metric": metric,
+                    "baseline": before[metric],
+                    "current": r[metric],
+                    "ratio": r[metric] / before[metric],
+                })
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run CAB harness microbenchmarks")
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="Comma-separated dataset sizes (up to 1000000)")
+    parser.add_argument("--only", help="Comma-separated benchmark names")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="Write results JSON here (stdout by default)")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare against")
+    parser.add_argument("--max-slowdown", type=float, default=1.5,
+                        help="Allowed time/memory ratio against the baseline")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    names = args.only.split(",") if args.only else None
+    report = run_benchmarks(sizes, names, repeat=args.repeat, seed=args.seed)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        report["regressions"] = find_regressions(report, baseline, args.max_slowdown)
+        for r in report["regressions"]:
+            print(f"REGRESSION {r['name']} n={r['size']} {r['metric']}: "
+                  f"{r['baseline']:.4g} -> {r['current']:.4g} ({r['ratio']:.2f}x)", file=sys.stderr)
+        status = 1 if report["regressions"] else 0
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Synthetic CAB datasets and results at arbitrary scale.
+
+Generated questions pass ``load_dataset`` validation. By default their
+mode mix and mean field lengths follow data/CAB_v2_Dataset_965.json (991
+questions): 75 objective (7.6%), questions of about 32 characters, options
+of about 24, scenarios of about 44 and rubric focus lines of about 50. Pass
+``objective_fraction`` to weight the mix toward objective scoring instead.
+
+Usage:
+    python -m benchmarks.synthetic 100000 -o synthetic_100k.json
+"""
+
+import argparse
+import json
+import random
+from typing import Dict, List, Optional
+
+from cab_benchmark.loader import DIMENSIONS, TRADITIONS
+
+_WORDS = (
+    "grace faith church scripture gospel covenant prayer mercy sin salvation "
+    "baptism communion spirit kingdom doctrine tradition council apostle "
+    "prophet law love hope creed worship pastor parish confession liturgy"
+).split()
+
+# Shape of the real dataset (see module docstring); word counts are chosen
+# so the mean character lengths match
+OBJECTIVE_FRACTION = 0.076
+QUESTION_WORDS = 4
+OPTION_WORDS = 3
+SCENARIO_WORDS = 6
+RUBRIC_WORDS = 7
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize()
+
+
+def generate_dataset(
+    n: int,
+    seed: int = 0,
+    objective_fraction: float = OBJECTIVE_FRACTION,
+) -> Dict:
+    """
+    Generate a schema-valid dataset of ``n`` questions.
+
+    Args:
+        n: Number of questions
+        seed: Random seed
+        objective_fraction: Share of objective (multiple-choice) questions
+
+    Returns:
+        Dataset dictionary in the ``load_dataset`` format
+    """
+    rng = random.Random(seed)
+    questions = []
+    for i in range(n):
+        q = {
+            "id": f"CAB-{i + 1:04d}",
+            "dimension": DIMENSIONS[i % len(DIMENSIONS)],
+            "tradition": rng.choice(TRADITIONS),
+            "difficulty": rng.choice(("L1", "L2", "L3")),
+        }
+        if rng.random() < objective_fraction:
+            q["scoring_mode"] = "objective"
+            q["question"] = _text(rng, QUESTION_WORDS) + "?"
+            q["options"] = [f"{letter}) {_text(rng, OPTION_WORDS)}" for letter in "ABCD"]
+            q["correct_answer"] = rng.choice("ABCD")
+        else:
+            q["scoring_mode"] = "subjective"
+            q["scenario"] = _text(rng, SCENARIO_WORDS) + "."
+            q["rubric_focus"] = _text(rng, RUBRIC_WORDS)
+        questions.append(q)
+
+    return {
+        "benchmark": "CAB",
+        "version": "synthetic",
+        "total_questions": n,
+        "questions": questions,
+    }
+
+
+def judge_response(rng: random.Random, score: int) -> str:
+    """A judge reply in the format ``SubjectiveScorer`` parses."""
+    return f"SCORE: {score}\nJUSTIFICATION: {_text(rng, 30)}."
+
+
+def generate_results(
+    questions: List[Dict],
+    seed: int = 0,
+    skill: float = 0.7,
+    num_judges: int = 3,
+    model: Optional[str] = None,
+) -> Dict:
+    """
+    Generate an ``evaluate``-shaped output for a dataset's questions.
+
+    Args:
+        questions: Questions from ``generate_dataset``
+        seed: Random seed
+        skill: Probability of a correct objective answer; also shifts judge scores
+        num_judges: Judges per subjective question
+        model: Model name recorded in the metadata
+
+    Returns:
+        Dictionary with metadata, summary and detailed_results
+    """
+    from cab_benchmark.aggregator import aggregate_scores
+
+    rng = random.Random(seed)
+    results = []
+    for q in questions:
+        result = {
+            "id": q["id"],
+            "dimension": q["dimension"],
+            "tradition": q["tradition"],
+            "difficulty": q["difficulty"],
+            "scoring_mode": q["scoring_mode"],
+        }
+        if q["scoring_mode"] == "objective":
+            correct = rng.random() < skill
+            answer = q["correct_answer"] if correct else rng.choice("ABCD".replace(q["correct_answer"], ""))
+            result["score"] = 1.0 if correct else 0.0
+            result["details"] = {
+                "correct_answer": q["correct_answer"],
+                "extracted_answer": answer,
+                "is_correct": correct,
+                "raw_response": answer,
+            }
+        else:
+            center = 1 + 4 * skill
+            raw = [max(1, min(5, round(rng.gauss(center, 0.8)))) for _ in range(num_judges)]
+            median = sorted(raw)[len(raw) // 2]
+            result["score"] = (median - 1) / 4.0
+            result["details"] = {
+                "raw_scores": raw,
+                "median_score": median,
+                "normalized_score": result["score"],
+                "justifications": [_text(rng, 30) for _ in raw],
+                "raw_response": _text(rng, 120),
+            }
+        results.append(result)
+
+    return {
+        "metadata": {"dataset_version": "synthetic", "model": model, "seed": seed},
+        "summary": aggregate_scores(results),
+        "detailed_results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic CAB dataset")
+    parser.add_argument("size", type=int, help="Number of questions")
+    parser.add_argument("--output", "-o", required=True, help="Dataset JSON file")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--objective-fraction", type=float, default=OBJECTIVE_FRACTION,
+                        help="Share of objective questions")
+    parser.add_argument("--results", help="Also write synthetic results for the dataset here")
+    args = parser.parse_args()
+
+    data = generate_dataset(args.size, seed=args.seed, objective_fraction=args.objective_fraction)
+    with open(args.output, "w") as f:
+        json.dump(data, f)
+    if args.results:
+        with open(args.results, "w") as f:
+            json.dump(generate_results(data["questions"], seed=args.seed), f)
+
+
+if __name__ == "__main__":
+    main()
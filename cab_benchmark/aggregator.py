@@ -106,12 +106,23 @@ def aggregate_scores(
     return output
 
 
-def compare_models(model_results: Dict[str, Dict]) -> Dict:
+def compare_models(
+    model_results: Dict[str, Dict],
+    detailed_results: Optional[Dict[str, List[Dict]]] = None,
+    n_permutations: int = 10000,
+    n_bootstrap: int = 10000,
+    seed: Optional[int] = 0,
+) -> Dict:
     """
     Compare aggregated results across multiple models.
     
     Args:
         model_results: Dictionary mapping model names to their aggregated results
+        detailed_results: Optional per-question results for each model; when
+            given, paired permutation/bootstrap tests are added
+        n_permutations: Sign-flip permutations for the permutation test
+        n_bootstrap: Replicates for the paired bootstrap
+        seed: Random seed for the significance tests
     
     Returns:
         Comparison summary
@@ -143,4 +154,13 @@ def compare_models(model_results: Dict[str, Dict]) -> Dict:
         dim_scores.sort(key=lambda x: x[1], reverse=True)
         comparison["dimension_rankings"][dim] = dim_scores
     
+    if detailed_results:
+        from .significance import significance_tests
+        comparison["significance"] = significance_tests(
+            detailed_results,
+            n_permutations=n_permutations,
+            n_bootstrap=n_bootstrap,
+            seed=seed,
+        )
+    
     return comparison
@@ -72,31 +72,407 @@ def sample(dataset, dimension, tradition, mode, limit, output):
             click.echo(f"  {text[:100]}...")
 
 
+def _load_model_fn(spec: str):
+    """Import a model callable from a 'package.module:function' spec."""
+    import importlib
+    
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise click.BadParameter(f"Expected 'module:function', got '{spec}'", param_hint="--model")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _make_judge_client(provider: str):
+    """Create a judge API client from environment credentials."""
+    if provider == "anthropic":
+        from anthropic import Anthropic
+        return Anthropic()
+    from openai import OpenAI
+    return OpenAI()
+
+
+@main.command()
+@click.argument("dataset", type=click.Path(exists=True))
+@click.option("--model", "model_spec", required=True, help="Model callable as 'module:function'")
+@click.option("--model-name", help="Name recorded in results metadata")
+@click.option("--judge-provider", type=click.Choice(["anthropic", "openai"]), help="Judge API provider")
+@click.option("--judge-model", default="claude-3-opus-20240229", help="Judge model")
+@click.option("--num-judges", type=int, default=3, help="Judges per subjective question")
+@click.option("--judge-mode", type=click.Choice(["panel", "logprob"]), default="panel",
+              help="Judge panel, or one logprob call per response (OpenAI judges)")
+@click.option("--dimension", "-d", multiple=True, help="Filter by dimension")
+@click.option("--tradition", "-t", multiple=True, help="Filter by tradition")
+@click.option("--mode", "-m", type=click.Choice(["objective", "subjective"]))
+@click.option("--limit", "-n", type=int, help="Limit number of questions")
+@click.option("--shard", help="Evaluate only shard i of N (0-based), e.g. 0/4")
+@click.option("--seed", type=int, help="Seed for option shuffling (set the same seed on every shard)")
+@click.option("--output", "-o", type=click.Path(), required=True, help="Output file")
+@click.option("--workers", type=int, default=1, help="Questions evaluated concurrently")
+@click.option("--compact", is_flag=True, help="Spill result details to a side file to save memory")
+@click.option("--hedge-percentile", type=float, help="Hedge calls slower than this latency percentile, e.g. 0.95")
+@click.option("--hedge-budget", type=float, default=0.05, help="Max extra calls as a fraction of calls")
+@click.option("--administrations", "-k", type=int, default=1,
+              help="Distinct option orders per objective question (reports consistency and position bias)")
+@click.option("--item-bank", type=click.Path(exists=True), help="Calibrated item bank; enables adaptive testing")
+@click.option("--se-target", type=float, default=0.3, help="Adaptive stopping standard error per dimension")
+@click.option("--prior", type=click.Path(exists=True),
+              help="Earlier results of this model; unchanged questions are reused")
+@click.option("--quiet", is_flag=True, help="Hide progress")
+def run(dataset, model_spec, model_name, judge_provider, judge_model, num_judges, judge_mode,
+        dimension, tradition, mode, limit, shard, seed, output, workers, compact,
+        hedge_percentile, hedge_budget, administrations, item_bank, se_target, prior, quiet):
+    """Run a CAB evaluation (optionally one shard of it)."""
+    from .evaluator import CABEvaluator
+    from .sharding import parse_shard
+    
+    try:
+        shard = parse_shard(shard) if shard else None
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--shard")
+    if shard and item_bank:
+        raise click.UsageError("--item-bank (adaptive testing) cannot be combined with --shard")
+    if shard and seed is None:
+        raise click.UsageError("--shard requires --seed (the same on every shard) for reproducible option order")
+    
+    evaluator = CABEvaluator(
+        model_fn=_load_model_fn(model_spec),
+        judge_client=_make_judge_client(judge_provider) if judge_provider else None,
+        judge_model=judge_model,
+        num_judges=num_judges,
+        judge_mode=judge_mode,
+        verbose=not quiet,
+        model_name=model_name or model_spec,
+        seed=seed,
+        max_workers=workers,
+        compact_results=compact,
+        hedge_percentile=hedge_percentile,
+        hedge_budget=hedge_budget,
+        administrations=administrations,
+    )
+    evaluator.evaluate(
+        dataset_path=dataset,
+        dimensions=list(dimension) if dimension else None,
+        traditions=list(tradition) if tradition else None,
+        scoring_mode=mode,
+        max_questions=limit,
+        output_path=output,
+        shard=shard,
+        item_bank=item_bank,
+        se_target=se_target,
+        prior_results=prior,
+    )
+
+
+@main.command()
+@click.argument("dataset", type=click.Path(exists=True))
+@click.argument("results", type=click.Path(exists=True))
+@click.option("--judge-provider", type=click.Choice(["anthropic", "openai"]), required=True, help="Judge API provider")
+@click.option("--judge-model", default="claude-3-opus-20240229", help="Judge model")
+@click.option("--num-judges", type=int, default=3, help="Judges per response in panel mode")
+@click.option("--judge-mode", type=click.Choice(["panel", "logprob"]), default="logprob")
+@click.option("--limit", "-n", type=int, help="Re-judge at most this many responses")
+@click.option("--workers", type=int, default=1, help="Responses judged concurrently")
+@click.option("--output", "-o", type=click.Path(), help="Save re-judged results")
+def rejudge(dataset, results, judge_provider, judge_model, num_judges, judge_mode, limit, workers, output):
+    """Re-judge stored responses and report agreement with the stored scores."""
+    from .evaluator import CABEvaluator
+    
+    try:
+        evaluator = CABEvaluator(
+            model_fn=None,
+            judge_client=_make_judge_client(judge_provider),
+            judge_model=judge_model,
+            num_judges=num_judges,
+            judge_mode=judge_mode,
+            max_workers=workers,
+        )
+    except ValueError as e:
+        raise click.UsageError(str(e))
+    
+    rejudged = evaluator.rejudge(results, dataset, max_questions=limit, output_path=output)
+    _echo_agreement(rejudged["summary"]["agreement"], rejudged["metadata"])
+
+
+def _echo_agreement(agreement: dict, metadata: dict) -> None:
+    """Print judge-mode agreement statistics."""
+    click.echo(f"\nJudge Agreement ({metadata.get('judge_mode')} vs stored "
+               f"{metadata.get('reference_judge_mode')}, n={agreement['items']}):")
+    if not agreement["items"]:
+        return
+    alpha = agreement["krippendorff_alpha"]
+    corr = agreement["correlation"]
+    click.echo(f"  Exact agreement: {agreement['exact_agreement']:.3f}")
+    click.echo(f"  Within one point: {agreement['within_one']:.3f}")
+    click.echo(f"  Mean abs error: {agreement['mean_abs_error']:.3f} "
+               f"(mean difference {agreement['mean_difference']:+.3f})")
+    click.echo(f"  Correlation: {corr:.3f}" if corr is not None else "  Correlation: N/A")
+    click.echo(f"  {agreement['metric'].capitalize()} alpha: {alpha:.3f}" if alpha is not None
+               else f"  {agreement['metric'].capitalize()} alpha: N/A")
+    calls = agreement["judge_calls"]
+    click.echo(f"  Judge calls: {calls['reference']} -> {calls['candidate']}")
+    tokens = agreement["judge_output_tokens"]
+    if tokens:
+        click.echo(f"  Judge output tokens: {tokens['reference']} -> {tokens['candidate']}")
+
+
+@main.command()
+@click.argument("dataset", type=click.Path(exists=True))
+@click.argument("results", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--output", "-o", type=click.Path(), required=True, help="Item bank JSON file")
+@click.option("--difficulty-sd", type=float, default=1.0, help="Prior SD of difficulty around its L1/L2/L3 level")
+def calibrate(dataset, results, output, difficulty_sd):
+    """Fit IRT item parameters from stored results (one file per run)."""
+    from .irt import calibrate as fit_item_bank
+    from .loader import load_dataset
+    
+    questions = load_dataset(dataset)["questions"]
+    bank = fit_item_bank(list(results), questions, difficulty_sd=difficulty_sd)
+    bank.save(output)
+    seen = sum(1 for item in bank.items.values() if item["n"])
+    click.echo(f"Calibrated {seen}/{len(bank)} items from {len(results)} runs into {output}")
+
+
+@main.command()
+@click.argument("output", type=click.Path())
+@click.argument("partials", nargs=-1, required=True, type=click.Path(exists=True))
+def merge(output, partials):
+    """Merge shard results into a single results file."""
+    from .results_io import save_results
+    from .sharding import merge_shards
+    
+    try:
+        merged = merge_shards(list(partials))
+    except ValueError as e:
+        click.echo(f"✗ Merge failed: {e}", err=True)
+        raise SystemExit(1)
+    
+    save_results(merged, output)
+    click.echo(f"Merged {len(partials)} shards ({merged['metadata']['total_questions']} questions) into {output}")
+
+
 @main.command()
 @click.argument("results", type=click.Path(exists=True))
 def summarize(results):
     """Summarize evaluation results."""
-    with open(results) as f:
-        data = json.load(f)
+    from .results_io import load_summary
     
+    data = load_summary(results)
     summary = data.get("summary", {})
+    incremental = data.get("metadata", {}).get("incremental")
     
     click.echo(f"\n{'='*50}")
     click.echo(f"CAB EVALUATION SUMMARY")
     click.echo(f"{'='*50}")
     
-    click.echo(f"\nOverall CAB Score: {summary.get('cab_score', 'N/A'):.3f}")
+    if "adaptive" in summary:
+        click.echo(f"\nOverall CAB Score (predicted from adaptive test): {summary.get('cab_score', 'N/A'):.3f}")
+    else:
+        click.echo(f"\nOverall CAB Score: {summary.get('cab_score', 'N/A'):.3f}")
     click.echo(f"Total Questions: {summary.get('total_questions', 'N/A')}")
+    if incremental:
+        click.echo(f"Carried over: {len(incremental['carried_over'])}, "
+                   f"recomputed: {len(incremental['recomputed'])}")
     
     if "by_dimension" in summary:
         click.echo(f"\nBy Dimension:")
         for dim, info in sorted(summary["by_dimension"].items()):
-            click.echo(f"  {dim}: {info['score']:.3f} (n={info['count']})")
+            pool = f"/{info['pool']}" if "pool" in info else ""
+            click.echo(f"  {dim}: {info['score']:.3f} (n={info['count']}{pool})")
     
     if "by_tradition" in summary:
         click.echo(f"\nBy Tradition:")
         for trad, info in sorted(summary["by_tradition"].items()):
             click.echo(f"  {trad}: {info['score']:.3f} (n={info['count']})")
+    
+    if "performance" in summary:
+        perf = summary["performance"]
+        click.echo(f"\nPerformance:")
+        if "wall_time" in perf:
+            click.echo(f"  Wall time: {perf['wall_time']:.1f}s")
+        for stage, stats in perf["stages"].items():
+            click.echo(f"  {stage}: p50={stats['p50']:.3f}s p95={stats['p95']:.3f}s "
+                       f"p99={stats['p99']:.3f}s total={stats['total']:.1f}s (n={stats['count']})")
+        for role, usage in perf["tokens"].items():
+            click.echo(f"  {role} tokens: {usage['input']} in / {usage['output']} out")
+        click.echo(f"  Retries: {perf['retries']}")
+    
+    if "agreement" in summary:
+        _echo_agreement(summary["agreement"], data.get("metadata", {}))
+    
+    if "adaptive" in summary:
+        ad = summary["adaptive"]
+        click.echo(f"\nAdaptive Testing ({ad['items']}/{ad['pool']} items, SE target {ad['se_target']:.2f}):")
+        click.echo(f"  Predicted pool score: {ad['predicted_score']:.3f}")
+        if "administered" in summary:
+            click.echo(f"  Administered-subset CAB score (not comparable): "
+                       f"{summary['administered']['cab_score']:.3f}")
+        for dim, info in sorted(ad["by_dimension"].items()):
+            click.echo(f"  {dim}: theta={info['theta']:+.2f} se={info['se']:.2f} "
+                       f"predicted={info['predicted_score']:.3f} (n={info['items']}/{info['pool']})")
+    
+    if "administrations" in summary:
+        adm = summary["administrations"]
+        bias = adm["position_bias"]
+        click.echo(f"\nAnswer-Order Robustness ({adm['administrations']} administrations):")
+        if adm["mean_consistency"] is not None:
+            click.echo(f"  Mean consistency: {adm['mean_consistency']:.3f}")
+        click.echo(f"  Fully consistent: {adm['fully_consistent']}/{adm['questions']}")
+        rates = " ".join(f"{p}={r:.2f}" for p, r in bias["choice_rate"].items())
+        click.echo(f"  Choice rate by position: {rates}")
+        if bias["p_value"] is not None:
+            click.echo(f"  Position bias: chi2={bias['chi_square']:.2f} (df={bias['df']}), p={bias['p_value']:.3g}")
+    
+    if "reliability" in summary:
+        rel = summary["reliability"]
+        alpha = rel["krippendorff_alpha"]
+        click.echo(f"\nJudge Reliability ({rel['metric']} alpha, target {rel['target']:.2f}):")
+        click.echo(f"  Overall: {alpha:.3f}" if alpha is not None else "  Overall: N/A")
+        for dim, info in sorted(rel["by_dimension"].items()):
+            value = f"{info['alpha']:.3f}" if info["alpha"] is not None else "N/A"
+            click.echo(f"  {dim}: {value} (n={info['units']})")
+        click.echo(f"  Low-agreement items: {rel['low_agreement']['count']}")
+
+
+@main.command()
+@click.argument("results", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--permutations", type=int, default=10000, help="Permutation test draws")
+@click.option("--bootstrap", type=int, default=10000, help="Bootstrap replicates")
+@click.option("--seed", type=int, default=0, help="Random seed")
+@click.option("--output", "-o", type=click.Path(), help="Output file")
+def compare(results, permutations, bootstrap, seed, output):
+    """Compare models with paired significance tests (one results file per model)."""
+    from .aggregator import compare_models
+    from .results_io import load_results
+    
+    summaries = {}
+    detailed = {}
+    for path in results:
+        data = load_results(path)
+        name = data.get("metadata", {}).get("model") or Path(path).stem
+        summaries[name] = data.get("summary", {})
+        detailed[name] = data.get("detailed_results", [])
+    
+    comparison = compare_models(
+        summaries,
+        detailed_results=detailed,
+        n_permutations=permutations,
+        n_bootstrap=bootstrap,
+        seed=seed,
+    )
+    sig = comparison["significance"]["overall"]
+    
+    click.echo(f"\n{'='*50}")
+    click.echo(f"CAB MODEL COMPARISON ({sig['n_questions']} shared questions)")
+    click.echo(f"{'='*50}")
+    
+    click.echo(f"\nRanking (mean score, {comparison['significance']['confidence']:.0%} rank set):")
+    ranked = sorted(sig["rank_confidence"].items(), key=lambda x: x[1]["rank"])
+    for name, info in ranked:
+        lo, hi = info["rank_ci"]
+        click.echo(f"  {info['rank']}. {name}: {info['mean_score']:.3f} [ranks {lo}-{hi}]")
+    
+    click.echo(f"\nPairwise tests:")
+    for pair in sig["pairs"]:
+        click.echo(
+            f"  {pair['model_a']} vs {pair['model_b']}: diff={pair['mean_diff']:+.3f} "
+            f"perm p={pair['permutation_p']:.4f} boot p={pair['bootstrap_p']:.4f}"
+        )
+    
+    if output:
+        with open(output, "w") as f:
+            json.dump(comparison, f, indent=2)
+        click.echo(f"\nComparison saved to {output}")
+
+
+@main.command()
+@click.argument("results", type=click.Path(exists=True))
+@click.option("--prometheus", type=click.Path(), help="Write Prometheus text metrics here")
+@click.option("--trace", type=click.Path(), help="Write OpenTelemetry (OTLP/JSON) spans here")
+def export(results, prometheus, trace):
+    """Export run timing and token metrics."""
+    from .results_io import load_results
+    from .telemetry import export_prometheus, export_trace
+    
+    if not prometheus and not trace:
+        raise click.UsageError("Specify --prometheus and/or --trace")
+    
+    data = load_results(results)
+    
+    if prometheus:
+        export_prometheus(data, prometheus)
+        click.echo(f"Prometheus metrics written to {prometheus}")
+    if trace:
+        export_trace(data, trace)
+        click.echo(f"Trace written to {trace}")
+
+
+@main.command()
+@click.argument("database", type=click.Path())
+@click.argument("results", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--model", help="Model name (default: results metadata or file name)")
+@click.option("--no-details", is_flag=True, help="Skip storing per-result details")
+def ingest(database, results, model, no_details):
+    """Ingest results files into a local SQLite warehouse."""
+    from .warehouse import ResultsWarehouse
+    
+    with ResultsWarehouse(database) as wh:
+        for path in results:
+            run_id = wh.ingest(path, model=model, keep_details=not no_details)
+            click.echo(f"Ingested {path} as run {run_id}")
+
+
+@main.command()
+@click.argument("database", type=click.Path(exists=True))
+@click.option("--model", multiple=True, help="Filter by model")
+@click.option("--run", multiple=True, type=int, help="Filter by run id")
+@click.option("--question", "-q", multiple=True, help="Filter by question id")
+@click.option("--dimension", "-d", multiple=True, help="Filter by dimension")
+@click.option("--tradition", "-t", multiple=True, help="Filter by tradition")
+@click.option("--mode", "-m", multiple=True, type=click.Choice(["objective", "subjective"]))
+@click.option("--since", help="Only runs at or after this ISO timestamp")
+@click.option("--until", help="Only runs before this ISO timestamp")
+@click.option("--group-by", "-g", multiple=True,
+              type=click.Choice(["model", "run", "question", "dimension", "tradition", "difficulty", "mode"]),
+              help="Aggregate mean score by these columns")
+def query(database, model, run, question, dimension, tradition, mode, since, until, group_by):
+    """Query per-question scores across ingested runs."""
+    from .warehouse import ResultsWarehouse
+    
+    filters = {
+        "model": model,
+        "run": run,
+        "question": question,
+        "dimension": dimension,
+        "tradition": tradition,
+        "mode": mode,
+    }
+    
+    with ResultsWarehouse(database) as wh:
+        if group_by:
+            for row in wh.summarize(list(group_by), since=since, until=until, **filters):
+                keys = " / ".join(str(row[k]) for k in group_by)
+                click.echo(f"  {keys}: {row['mean_score']:.3f} (n={row['count']})")
+        else:
+            for row in wh.query(since=since, until=until, **filters):
+                click.echo(
+                    f"  {row['model']}\t{row['run_id']}\t{row['question_id']}\t"
+                    f"{row['dimension']}\t{row['tradition']}\t{row['score']:.3f}"
+                )
+
+
+@main.command()
+@click.argument("database", type=click.Path(exists=True))
+@click.option("--model", multiple=True, help="Filter by model")
+def runs(database, model):
+    """List runs stored in a results warehouse."""
+    from .warehouse import ResultsWarehouse
+    
+    with ResultsWarehouse(database) as wh:
+        for row in wh.runs(model=list(model) or None):
+            score = row["cab_score"] if row["cab_score"] is not None else row["overall_score"]
+            score = f"{score:.3f}" if score is not None else "N/A"
+            click.echo(f"  [{row['run_id']}] {row['model']} {row['timestamp']} "
+                       f"CAB={score} (n={row['total_questions']})")
 
 
 if __name__ == "__main__":
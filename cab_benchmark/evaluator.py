@@ -1,15 +1,33 @@
 """Main evaluation orchestration."""
 
-import json
+import itertools
 import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from typing import Dict, Iterator, List, Optional, Callable, Tuple, Union
 from tqdm import tqdm
 
+from .hedging import Hedger
 from .loader import load_dataset, filter_questions
 from .scorer import ObjectiveScorer, SubjectiveScorer
 from .aggregator import aggregate_scores
+from .records import CompactResult, SpillStore
+from .reliability import ReliabilityTracker, judge_mode_agreement
+from .robustness import PositionBiasTracker
+from .irt import AdaptiveTester, ItemBank, adaptive_summary
+from .incremental import content_hash, load_reusable, reuse_result
+from .results_io import ResultsWriter, is_jsonl, load_results, save_results
+from .scheduler import LatencyScheduler, load_latency_history
+from .sharding import select_shard
+from .telemetry import (
+    QuestionTrace,
+    TimingRollup,
+    call_with_retries,
+    split_model_output,
+    summarize_timings,
+)
 
 
 class CABEvaluator:
@@ -33,17 +51,58 @@ class CABEvaluator:
         num_judges: int = 3,
         randomize_options: bool = True,
         verbose: bool = True,
+        reliability_metric: str = "ordinal",
+        max_judge_spread: int = 2,
+        model_name: Optional[str] = None,
+        seed: Optional[int] = None,
+        max_retries: int = 0,
+        max_workers: int = 1,
+        schedule: str = "longest_first",
+        compact_results: bool = False,
+        hedge_percentile: Optional[float] = None,
+        hedge_budget: float = 0.05,
+        administrations: int = 1,
+        batch_model_fn: Optional[Callable[[List[str]], List[str]]] = None,
+        judge_mode: str = "panel",
     ):
         """
         Initialize evaluator.
         
         Args:
             model_fn: Function that takes a prompt and returns model response
+                (or a ``(response, usage)`` tuple with 'input_tokens' and
+                'output_tokens' to record token usage)
             judge_client: API client for LLM judge (Anthropic or OpenAI)
             judge_model: Model to use for judging subjective questions
             num_judges: Number of judges for subjective questions
             randomize_options: Whether to randomize multiple choice options
             verbose: Whether to show progress
+            reliability_metric: Krippendorff's alpha metric for judge agreement
+            max_judge_spread: Judge score range at which an item is flagged
+            model_name: Name recorded in the results metadata
+            seed: Seed for option shuffling (per question, so reproducible
+                across runs and shards)
+            max_retries: Retries for failed model and judge calls
+            max_workers: Questions evaluated concurrently (model_fn and the
+                judge client must be thread-safe when > 1)
+            schedule: Dispatch order, 'longest_first' (estimated cost) or
+                'dataset' (file order); results are always in dataset order
+            compact_results: Keep only ids, categorical codes and scores in
+                memory, spilling each result's details to a side file that
+                is read back lazily
+            hedge_percentile: If set (e.g. 0.95), send a duplicate model or
+                judge request once a call runs past this percentile of
+                observed latency and use whichever answers first
+            hedge_budget: Maximum duplicate requests as a fraction of calls
+            administrations: Distinct option orders presented per objective
+                question; k > 1 reports per-question consistency and a
+                position-bias statistic, scoring the fraction answered correctly
+            batch_model_fn: Optional function answering a list of prompts at
+                once, used for the administrations of a question instead of
+                concurrent model_fn calls
+            judge_mode: 'panel' (num_judges full judgments per response) or
+                'logprob' (one single-token call reading the probability of
+                each score; OpenAI judges only)
         """
         self.model_fn = model_fn
         self.judge_client = judge_client
@@ -51,8 +110,23 @@ class CABEvaluator:
         self.num_judges = num_judges
         self.randomize_options = randomize_options
         self.verbose = verbose
+        self.reliability_metric = reliability_metric
+        self.max_judge_spread = max_judge_spread
+        self.model_name = model_name
+        self.seed = seed
+        self.max_retries = max_retries
+        self.max_workers = max_workers
+        self.schedule = schedule
+        self.compact_results = compact_results
+        self.hedge_percentile = hedge_percentile
+        self.hedge_budget = hedge_budget
+        self.administrations = administrations
+        self.batch_model_fn = batch_model_fn
+        self.judge_mode = judge_mode
+        self._hedger = None
+        self._admin_pool = None
         
-        self.objective_scorer = ObjectiveScorer(randomize_options=randomize_options)
+        self.objective_scorer = ObjectiveScorer(randomize_options=randomize_options, seed=seed)
         self.subjective_scorer = None
         
         if judge_client:
@@ -64,6 +138,8 @@ class CABEvaluator:
                     judge_client=judge_client,
                     judge_model=judge_model,
                     num_judges=num_judges,
+                    max_retries=max_retries,
+                    judge_mode=judge_mode,
                 )
             elif "openai" in client_type:
                 from .scorer import OpenAISubjectiveScorer
@@ -71,6 +147,8 @@ class CABEvaluator:
                     judge_client=judge_client,
                     judge_model=judge_model,
                     num_judges=num_judges,
+                    max_retries=max_retries,
+                    judge_mode=judge_mode,
                 )
     
     def evaluate(
@@ -81,6 +159,12 @@ class CABEvaluator:
         scoring_mode: Optional[str] = None,
         max_questions: Optional[int] = None,
         output_path: Optional[str] = None,
+        shard: Optional[Tuple[int, int]] = None,
+        latency_history: Optional[Union[str, Dict, List[Dict]]] = None,
+        spill_path: Optional[str] = None,
+        item_bank: Optional[Union[str, ItemBank]] = None,
+        se_target: float = 0.3,
+        prior_results: Optional[Union[str, Dict]] = None,
     ) -> Dict:
         """
         Run evaluation on dataset.
@@ -91,7 +175,26 @@ class CABEvaluator:
             traditions: Filter to specific traditions
             scoring_mode: Filter to 'objective' or 'subjective'
             max_questions: Limit number of questions (for testing)
-            output_path: Path to save results JSON
+            output_path: Path to save results; ``.jsonl``, ``.jsonl.gz`` or
+                ``.jsonl.zst`` streams each result to disk as it completes,
+                with the summary in a small sidecar file
+            shard: (index, count) to evaluate only one stable partition of the
+                selected questions; combine shard outputs with ``merge_shards``
+            latency_history: Earlier results (path, output dict or
+                {id: seconds}) whose observed latency informs scheduling
+            spill_path: Side file for result details when compact_results is
+                set (a temporary file by default)
+            item_bank: Calibrated ItemBank (or path to one) enabling adaptive
+                mode: each dimension is asked its most informative remaining
+                question until the ability standard error reaches se_target;
+                headline scores are the predicted pool scores
+            se_target: Per-dimension standard error at which adaptive
+                testing stops
+            prior_results: Earlier results (path or output dict) of the same
+                model; questions whose content hash is unchanged reuse their
+                prior result and only new or modified questions are run; a
+                prior run with a different scoring setup is rejected, and one
+                too old to record its setup is ignored with a warning
         
         Returns:
             Evaluation results dictionary
@@ -111,45 +214,360 @@ class CABEvaluator:
         if max_questions:
             questions = questions[:max_questions]
         
+        selected = len(questions)
+        if shard and item_bank is not None:
+            raise ValueError("Adaptive evaluation cannot be sharded")
+        if shard and self.randomize_options and self.seed is None:
+            # Unseeded shuffles differ per process, so shards would not merge
+            # into what a single run produces
+            raise ValueError("Sharded evaluation with randomized options requires a seed")
+        if prior_results is not None and item_bank is not None:
+            raise ValueError("Adaptive evaluation cannot reuse prior results")
+        if shard:
+            questions, positions = select_shard(questions, *shard)
+        
         if self.verbose:
             print(f"Evaluating {len(questions)} questions...")
         
+        metadata = {
+            "dataset_version": data.get("version", "unknown"),
+            "model": self.model_name,
+            "seed": self.seed,
+            "timestamp": datetime.now().isoformat(),
+            "total_questions": len(questions),
+            "judge_mode": self.judge_mode,
+            "judge": self._judge_settings(),
+            "randomize_options": self.randomize_options,
+            "filters": {
+                "dimensions": dimensions,
+                "traditions": traditions,
+                "scoring_mode": scoring_mode,
+            },
+        }
+        
+        if shard:
+            metadata["shard"] = {
+                "index": shard[0],
+                "count": shard[1],
+                "selected_questions": selected,
+                "positions": positions,
+            }
+        
+        tester = None
+        if item_bank is not None:
+            if not isinstance(item_bank, ItemBank):
+                item_bank = ItemBank.load(item_bank)
+            tester = AdaptiveTester(questions, item_bank, se_target=se_target)
+            metadata["adaptive"] = {
+                "se_target": se_target,
+                "pool_size": len(questions),
+                "item_bank": item_bank.metadata,
+            }
+        
+        carried = {}
+        if prior_results is not None:
+            hashes = [content_hash(q) for q in questions]
+            reusable = load_reusable(
+                prior_results,
+                set(hashes),
+                model=self.model_name,
+                administrations=self.administrations,
+                judge_mode=self.judge_mode,
+                judge=self._judge_settings(),
+                randomize_options=self.randomize_options,
+            )
+            for index, (q, digest) in enumerate(zip(questions, hashes)):
+                if digest in reusable:
+                    carried[index] = reuse_result(reusable[digest], q, digest)
+            metadata["incremental"] = {
+                "prior_results": None if isinstance(prior_results, dict) else str(prior_results),
+                "carried_over": [q["id"] for i, q in enumerate(questions) if i in carried],
+                "recomputed": [q["id"] for i, q in enumerate(questions) if i not in carried],
+            }
+            if self.verbose:
+                print(f"Reusing {len(carried)} unchanged results; "
+                      f"{len(questions) - len(carried)} questions to run")
+        
+        writer = None
+        if output_path and is_jsonl(output_path):
+            writer = ResultsWriter(output_path, metadata)
+        
         # Run evaluation
-        results = []
-        iterator = tqdm(questions) if self.verbose else questions
+        results = [None] * len(questions)
+        progress = tqdm(total=len(questions)) if self.verbose else None
+        run_start = time.perf_counter()
+        reliability = ReliabilityTracker(
+            metric=self.reliability_metric,
+            max_spread=self.max_judge_spread,
+        )
+        history = load_latency_history(latency_history) if latency_history else None
+        timings = TimingRollup()
+        store = SpillStore(spill_path) if self.compact_results else None
+        position_bias = PositionBiasTracker()
+        self._start_hedging()
+        if self.administrations > 1 and not self.batch_model_fn:
+            self._admin_pool = ThreadPoolExecutor(
+                max_workers=self.administrations * max(1, self.max_workers)
+            )
+        
+        if tester:
+            stream = self._run_adaptive(questions, tester, history)
+        elif carried:
+            pending = [i for i in range(len(questions)) if i not in carried]
+            stream = itertools.chain(
+                carried.items(),
+                ((pending[i], r) for i, r in self._run_questions([questions[j] for j in pending], history)),
+            )
+        else:
+            stream = self._run_questions(questions, history)
+        
+        try:
+            for index, result in stream:
+                self._track_reliability(reliability, result)
+                position_bias.update(result)
+                if index not in carried:
+                    # Carried-over timings belong to the prior run
+                    timings.add(result)
+                if writer:
+                    writer.write(result)
+                results[index] = CompactResult(result, store) if store else result
+                if progress:
+                    progress.update(1)
+        except BaseException:
+            # Keep what was streamed so far readable
+            if writer:
+                writer.close()
+            raise
+        finally:
+            if progress:
+                progress.close()
+            hedging = self._stop_hedging()
+            if self._admin_pool:
+                self._admin_pool.shutdown()
+                self._admin_pool = None
         
-        for q in iterator:
-            result = self._evaluate_question(q)
-            results.append(result)
+        if hedging:
+            metadata["hedging"] = hedging
+        if self.administrations > 1:
+            metadata["administrations"] = self.administrations
+        if tester:
+            # Only administered questions have results
+            questions = [q for q, r in zip(questions, results) if r is not None]
+            results = [r for r in results if r is not None]
+            metadata["total_questions"] = len(results)
         
         # Aggregate
         aggregated = aggregate_scores(results)
+        if reliability.overall.units:
+            aggregated["reliability"] = reliability.report()
+        if position_bias.administrations:
+            aggregated["administrations"] = position_bias.report()
+        if tester:
+            aggregated = adaptive_summary(aggregated, tester.report())
+        aggregated["performance"] = timings.report()
+        aggregated["performance"]["wall_time"] = time.perf_counter() - run_start
         
         # Build output
         output = {
-            "metadata": {
-                "dataset_version": data.get("version", "unknown"),
-                "timestamp": datetime.now().isoformat(),
-                "total_questions": len(questions),
-                "filters": {
-                    "dimensions": dimensions,
-                    "traditions": traditions,
-                    "scoring_mode": scoring_mode,
-                },
-            },
+            "metadata": metadata,
             "summary": aggregated,
             "detailed_results": results,
         }
         
         # Save if requested
-        if output_path:
-            with open(output_path, "w") as f:
-                json.dump(output, f, indent=2)
+        if writer:
+            writer.finish(aggregated, order=[q["id"] for q in questions], metadata=metadata)
+            writer.close()
+        elif output_path:
+            save_results(output, output_path)
             if self.verbose:
                 print(f"Results saved to {output_path}")
         
         return output
     
+    def rejudge(
+        self,
+        results: Union[str, Dict],
+        dataset_path: str,
+        max_questions: Optional[int] = None,
+        output_path: Optional[str] = None,
+    ) -> Dict:
+        """
+        Re-score the stored responses of an earlier run with this judge setup.
+        
+        No model calls are made. The summary includes the agreement of the
+        new scores with the stored ones, e.g. to validate logprob judging
+        against an existing panel run.
+        
+        Args:
+            results: Earlier results (path or output dict) with stored responses
+            dataset_path: Dataset the results were produced from
+            max_questions: Re-judge at most this many subjective results
+            output_path: Path to save the re-judged results
+        
+        Returns:
+            Results dictionary for the re-judged subjective questions
+        """
+        if self.subjective_scorer is None:
+            raise ValueError("Re-judging requires a judge_client")
+        
+        questions = {q["id"]: q for q in load_dataset(dataset_path)["questions"]}
+        source = results if isinstance(results, dict) else load_results(results)
+        stored = [
+            r for r in source["detailed_results"]
+            if r.get("scoring_mode") == "subjective" and r["id"] in questions
+            and "raw_response" in (r.get("details") or {})
+        ][:max_questions]
+        
+        def rescore(prior: Dict) -> Dict:
+            trace = QuestionTrace()
+            score, details = self.subjective_scorer.score(
+                questions[prior["id"]], prior["details"]["raw_response"], trace=trace
+            )
+            details["timing"] = trace.to_dict()
+            result = {k: prior[k] for k in ("id", "dimension", "tradition", "difficulty", "scoring_mode")}
+            result.update({"score": score, "details": details})
+            return result
+        
+        self._start_hedging()
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+                rejudged = list(tqdm(pool.map(rescore, stored), total=len(stored), disable=not self.verbose))
+        finally:
+            hedging = self._stop_hedging()
+        
+        summary = aggregate_scores(rejudged)
+        summary["agreement"] = judge_mode_agreement(stored, rejudged, metric=self.reliability_metric)
+        summary["performance"] = summarize_timings(rejudged)
+        
+        metadata = {
+            "dataset_version": source.get("metadata", {}).get("dataset_version", "unknown"),
+            "model": source.get("metadata", {}).get("model"),
+            "timestamp": datetime.now().isoformat(),
+            "total_questions": len(rejudged),
+            "judge_mode": self.judge_mode,
+            "judge": self._judge_settings(),
+            "rejudged_from": None if isinstance(results, dict) else str(results),
+            "reference_judge_mode": source.get("metadata", {}).get("judge_mode", "panel"),
+        }
+        if hedging:
+            metadata["hedging"] = hedging
+        
+        output = {"metadata": metadata, "summary": summary, "detailed_results": rejudged}
+        if output_path:
+            save_results(output, output_path)
+        return output
+    
+    def _judge_settings(self) -> Optional[Dict]:
+        """Judge configuration recorded in run metadata (None without a judge)."""
+        if self.subjective_scorer is None:
+            return None
+        return {
+            "model": self.subjective_scorer.judge_model,
+            "num_judges": self.subjective_scorer.num_judges,
+        }
+    
+    def _start_hedging(self) -> None:
+        """Attach a fresh Hedger to model and judge calls for this run."""
+        if not self.hedge_percentile:
+            return
+        # Room for a primary and a duplicate of every concurrent call, so no
+        # call queues in the hedger's pool (queue time would count as latency)
+        concurrent_calls = max(1, self.max_workers) * max(1, self.administrations)
+        self._hedger = Hedger(
+            percentile=self.hedge_percentile,
+            budget=self.hedge_budget,
+            max_workers=4 * concurrent_calls + 4,
+        )
+        if self.subjective_scorer:
+            self.subjective_scorer.hedger = self._hedger
+    
+    def _stop_hedging(self) -> Optional[Dict]:
+        """Detach the run's Hedger and return its statistics."""
+        hedger, self._hedger = self._hedger, None
+        if hedger is None:
+            return None
+        if self.subjective_scorer:
+            self.subjective_scorer.hedger = None
+        hedger.close()
+        return hedger.report()
+    
+    def _dispatch_order(self, questions: List[Dict], history: Optional[Dict]):
+        """Scheduler yielding question indices in dispatch order."""
+        if self.schedule == "longest_first":
+            # A logprob judge makes one call per response whatever num_judges is
+            num_judges = 1 if self.judge_mode == "logprob" else self.num_judges
+            return LatencyScheduler(questions, num_judges=num_judges, history=history)
+        if self.schedule != "dataset":
+            raise ValueError(f"Unknown schedule: {self.schedule}")
+        return None
+    
+    def _run_questions(
+        self,
+        questions: List[Dict],
+        history: Optional[Dict] = None,
+    ) -> Iterator[Tuple[int, Dict]]:
+        """Evaluate questions, yielding (index, result) as each completes."""
+        scheduler = self._dispatch_order(questions, history)
+        pending = list(range(len(questions) - 1, -1, -1))
+        
+        def next_index():
+            return scheduler.pop() if scheduler is not None else pending.pop()
+        
+        def observe(index, result):
+            if scheduler is not None:
+                scheduler.observe(index, result["details"]["timing"]["total"])
+        
+        if self.max_workers <= 1:
+            for _ in range(len(questions)):
+                index = next_index()
+                result = self._evaluate_question(questions[index])
+                observe(index, result)
+                yield index, result
+            return
+        
+        # Keep at most max_workers questions in flight, choosing each next
+        # question only when a worker frees up so estimates stay current
+        remaining = len(questions)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            in_flight = {}
+            while remaining or in_flight:
+                while remaining and len(in_flight) < self.max_workers:
+                    index = next_index()
+                    in_flight[pool.submit(self._evaluate_question, questions[index])] = index
+                    remaining -= 1
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = in_flight.pop(future)
+                    result = future.result()
+                    observe(index, result)
+                    yield index, result
+    
+    def _run_adaptive(
+        self, questions: List[Dict], tester: AdaptiveTester, history: Optional[Dict]
+    ) -> Iterator[Tuple[int, Dict]]:
+        """Yield (index, result) in adaptive rounds, one question per open dimension."""
+        while True:
+            batch = tester.next_batch()
+            if not batch:
+                return
+            for i, result in self._run_questions([questions[j] for j in batch], history):
+                tester.observe(batch[i], result["score"])
+                yield batch[i], result
+    
+    def _track_reliability(self, tracker: ReliabilityTracker, result: Dict) -> None:
+        """Update judge agreement and flag low-agreement items as they arrive."""
+        if result["scoring_mode"] != "subjective":
+            return
+        
+        flagged = tracker.update(result)
+        result["details"]["low_agreement"] = flagged
+        
+        if flagged and self.verbose:
+            scores = result["details"]["raw_scores"]
+            tqdm.write(f"Low judge agreement on {result['id']}: {scores}")
+    
     def _evaluate_question(self, question: Dict) -> Dict:
         """Evaluate a single question."""
         result = {
@@ -158,17 +576,28 @@ class CABEvaluator:
             "tradition": question["tradition"],
             "difficulty": question["difficulty"],
             "scoring_mode": question["scoring_mode"],
+            "content_hash": content_hash(question),
         }
         
-        if question["scoring_mode"] == "objective":
+        trace = QuestionTrace()
+        
+        if question["scoring_mode"] == "objective" and self.administrations > 1:
+            score, score_meta = self._evaluate_administrations(question, trace)
+            
+            result["score"] = score
+            result["details"] = score_meta
+            
+        elif question["scoring_mode"] == "objective":
             # Prepare and present question
-            prompt, metadata = self.objective_scorer.prepare_question(question)
+            with trace.span("prepare"):
+                prompt, metadata = self.objective_scorer.prepare_question(question)
             
             # Get model response
-            response = self.model_fn(prompt)
+            response = self._call_model(prompt, trace)
             
             # Score
-            score, score_meta = self.objective_scorer.score(question, response, metadata)
+            with trace.span("score"):
+                score, score_meta = self.objective_scorer.score(question, response, metadata)
             
             result["score"] = score
             result["details"] = score_meta
@@ -178,18 +607,59 @@ class CABEvaluator:
                 raise ValueError("Subjective scorer not configured. Provide judge_client.")
             
             # Present scenario
-            prompt = self.subjective_scorer.prepare_question(question)
+            with trace.span("prepare"):
+                prompt = self.subjective_scorer.prepare_question(question)
             
             # Get model response
-            response = self.model_fn(prompt)
+            response = self._call_model(prompt, trace)
             
-            # Score with judges
-            score, score_meta = self.subjective_scorer.score(question, response)
+            # Score with judges (judge and parse spans are recorded by the scorer)
+            score, score_meta = self.subjective_scorer.score(question, response, trace=trace)
             
             result["score"] = score
             result["details"] = score_meta
         
+        result["details"]["timing"] = trace.to_dict()
         return result
+    
+    def _evaluate_administrations(self, question: Dict, trace: QuestionTrace) -> Tuple[float, Dict]:
+        """Present k option orders of an objective question in one pass."""
+        with trace.span("prepare"):
+            prepared = self.objective_scorer.prepare_administrations(question, self.administrations)
+        
+        # Identical prompts (e.g. duplicate option texts) are asked only once
+        prompts = list(dict.fromkeys(prompt for prompt, _ in prepared))
+        
+        if self.batch_model_fn:
+            with trace.span("model", batch=len(prompts)):
+                outputs = call_with_retries(self.batch_model_fn, prompts, trace, self.max_retries)
+            answers = {}
+            for prompt, output in zip(prompts, outputs):
+                answers[prompt], usage = split_model_output(output)
+                trace.add_tokens("model", usage)
+        else:
+            futures = {p: self._admin_pool.submit(self._call_model, p, trace) for p in prompts}
+            answers = {p: f.result() for p, f in futures.items()}
+        
+        with trace.span("score"):
+            score, details = self.objective_scorer.score_administrations(
+                question,
+                [answers[prompt] for prompt, _ in prepared],
+                [meta for _, meta in prepared],
+            )
+        details["unique_prompts"] = len(prompts)
+        return score, details
+    
+    def _call_model(self, prompt: str, trace: QuestionTrace) -> str:
+        """Call model_fn with timing, token accounting and retries."""
+        model_fn = self.model_fn
+        if self._hedger is not None:
+            model_fn = partial(self._hedger.call, "model", self.model_fn)
+        with trace.span("model"):
+            output = call_with_retries(model_fn, prompt, trace, self.max_retries)
+        response, usage = split_model_output(output)
+        trace.add_tokens("model", usage)
+        return response
 
 
 def quick_evaluate(
@@ -0,0 +1,163 @@
+"""Hedged requests to cut tail latency of model and judge calls."""
+
+import threading
+import time
+from collections import deque
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, Optional
+
+
+class Hedger:
+    """
+    Fire a duplicate request when a call runs past a latency percentile.
+
+    Latency is tracked separately per call kind ('model', 'judge'). Once
+    enough calls have been observed, a call still running after the chosen
+    percentile of observed latency gets one duplicate; whichever finishes
+    first is used. Python threads cannot be interrupted, so the losing
+    request is abandoned and its result discarded. Duplicates are capped at
+    ``budget`` times the number of calls made so far.
+
+    Example usage:
+        hedger = Hedger(percentile=0.95, budget=0.05)
+        response = hedger.call("model", model_fn, prompt)
+        hedger.report()
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        window: int = 1000,
+        max_workers: int = 32,
+    ):
+        """
+        Initialize hedger.
+
+        Args:
+            percentile: Observed-latency percentile after which to hedge
+            budget: Maximum duplicate calls as a fraction of all calls
+            min_samples: Calls of a kind observed before hedging starts
+            window: Recent latencies kept per kind
+            max_workers: Threads available for primary and duplicate calls
+        """
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cab-hedge")
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, deque] = {}
+        self._observed: Dict[str, int] = {}
+        self._window = window
+        self._thresholds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.hedges: Dict[str, int] = {}
+        self.hedge_wins: Dict[str, int] = {}
+        # [time the duplicate won, time the abandoned primary finished]
+        self._wins = []
+
+    def threshold(self, kind: str) -> Optional[float]:
+        """Current hedging delay for a call kind (None until enough samples)."""
+        with self._lock:
+            return self._thresholds.get(kind)
+
+    def _observe(self, kind: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._latencies.setdefault(kind, deque(maxlen=self._window))
+            samples.append(seconds)
+            count = self._observed[kind] = self._observed.get(kind, 0) + 1
+            if count < self.min_samples:
+                return
+            # Refresh the percentile periodically rather than on every call
+            if kind in self._thresholds and count % 10:
+                return
+            ordered = sorted(samples)
+            k = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+            self._thresholds[kind] = ordered[k]
+
+    def _may_hedge(self, kind: str) -> bool:
+        with self._lock:
+            total_calls = sum(self.calls.values())
+            total_hedges = sum(self.hedges.values())
+            if total_hedges + 1 > self.budget * total_calls:
+                return False
+            self.hedges[kind] = self.hedges.get(kind, 0) + 1
+            return True
+
+    def call(self, kind: str, fn: Callable, arg):
+        """Call ``fn(arg)``, hedging with a duplicate if it runs long."""
+        with self._lock:
+            self.calls[kind] = self.calls.get(kind, 0) + 1
+        delay = self.threshold(kind)
+
+        start = time.perf_counter()
+        if delay is None:
+            result = fn(arg)
+            self._observe(kind, time.perf_counter() - start)
+            return result
+
+        primary = self._pool.submit(fn, arg)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._may_hedge(kind):
+            result = primary.result()
+            self._observe(kind, time.perf_counter() - start)
+            return result
+
+        backup = self._pool.submit(fn, arg)
+        pending = {primary, backup}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            succeeded = [f for f in done if f.exception() is None]
+            if not succeeded and pending:
+                # Fall back to the other request if one fails
+                continue
+
+            future = succeeded[0] if succeeded else done.pop()
+            finished = time.perf_counter()
+            self._observe(kind, finished - start)
+            if future is backup and succeeded:
+                with self._lock:
+                    self.hedge_wins[kind] = self.hedge_wins.get(kind, 0) + 1
+                    win = [finished, None]
+                    self._wins.append(win)
+                primary.add_done_callback(partial(self._primary_done, win))
+            for other in pending:
+                other.cancel()
+            return future.result()
+
+    def _primary_done(self, win: list, _future) -> None:
+        with self._lock:
+            win[1] = time.perf_counter()
+
+    def latency_saved(self) -> float:
+        """
+        Seconds by which winning duplicates beat their primaries.
+
+        Primaries still running count up to now, so this is a lower bound.
+        """
+        now = time.perf_counter()
+        with self._lock:
+            return sum((end if end is not None else now) - won for won, end in self._wins)
+
+    def report(self) -> Dict:
+        """Hedging statistics for the run metadata."""
+        saved = self.latency_saved()
+        with self._lock:
+            calls = sum(self.calls.values())
+            hedges = sum(self.hedges.values())
+            return {
+                "percentile": self.percentile,
+                "budget": self.budget,
+                "calls": dict(self.calls),
+                "hedges": dict(self.hedges),
+                "hedge_wins": dict(self.hedge_wins),
+                "hedge_rate": hedges / calls if calls else 0.0,
+                "thresholds": dict(self._thresholds),
+                "latency_saved": saved,
+            }
+
+    def close(self) -> None:
+        """Release worker threads without waiting for abandoned requests."""
+        self._pool.shutdown(wait=False)
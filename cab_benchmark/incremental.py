@@ -0,0 +1,120 @@
+"""Reuse of prior results for questions unchanged across dataset versions."""
+
+import copy
+import hashlib
+import json
+import warnings
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Union
+
+from .results_io import iter_results, load_summary
+
+# Question fields that determine what the model is asked and how it is scored
+HASH_FIELDS = {
+    "objective": ("question", "options", "correct_answer"),
+    "subjective": ("scenario", "rubric_focus"),
+}
+
+
+def content_hash(question: Dict) -> str:
+    """
+    Stable hash of a question's content.
+
+    Covers the prompt and scoring fields for its mode plus the tradition,
+    but not the ID, dimension or difficulty label, so relabelled or
+    renumbered questions keep their hash.
+    """
+    mode = question["scoring_mode"]
+    content = {field: question.get(field) for field in HASH_FIELDS.get(mode, ())}
+    content["scoring_mode"] = mode
+    content["tradition"] = question.get("tradition")
+    encoded = json.dumps(content, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def load_reusable(
+    source: Union[str, Path, Dict],
+    hashes: Optional[Set[str]] = None,
+    model: Optional[str] = None,
+    administrations: int = 1,
+    judge_mode: str = "panel",
+    judge: Optional[Dict] = None,
+    randomize_options: bool = True,
+) -> Dict[str, Dict]:
+    """
+    Results of a prior run keyed by content hash.
+
+    Only results that recorded a content hash can be reused. Runs that
+    predate hashing, or that do not record their option shuffling and judge
+    settings, cannot be matched against the current setup: nothing is
+    reused and every question is recomputed, with a warning.
+
+    Args:
+        source: Prior results file or ``evaluate`` output
+        hashes: Keep only results with these hashes (streams large files)
+        model: Current model name; a prior run of another model is rejected
+        administrations: Current administrations per objective question;
+            a prior run with a different protocol is rejected
+        judge_mode: Current judge mode; a prior run judged otherwise is rejected
+        judge: Current judge settings ({'model', 'num_judges'}, None without a
+            judge); must match a prior run that used a judge
+        randomize_options: Current option shuffling; must match the prior run
+
+    Returns:
+        Dictionary mapping content hash to prior result
+    """
+    if isinstance(source, dict):
+        metadata = source.get("metadata", {})
+        results: Iterable[Dict] = source["detailed_results"]
+    else:
+        metadata = load_summary(source).get("metadata", {})
+        results = iter_results(source)
+
+    prior_model = metadata.get("model")
+    if model and prior_model and prior_model != model:
+        raise ValueError(f"Prior results are for model '{prior_model}', not '{model}'")
+    if metadata.get("administrations", 1) != administrations:
+        raise ValueError(
+            f"Prior results used {metadata.get('administrations', 1)} administrations "
+            f"per question, not {administrations}"
+        )
+    if metadata.get("judge_mode", "panel") != judge_mode:
+        raise ValueError(
+            f"Prior results were judged in {metadata.get('judge_mode', 'panel')} mode, not {judge_mode}"
+        )
+    unrecorded = [key for key in ("randomize_options", "judge") if key not in metadata]
+    if unrecorded:
+        warnings.warn(
+            f"Prior results do not record {' or '.join(unrecorded)}; "
+            "recomputing every question"
+        )
+        return {}
+    if metadata["randomize_options"] != randomize_options:
+        raise ValueError(
+            f"Prior results used randomize_options={metadata['randomize_options']}, "
+            f"not {randomize_options}"
+        )
+    # A run without a judge has no subjective results, so any judge may follow it
+    if metadata["judge"] is not None and metadata["judge"] != judge:
+        raise ValueError(f"Prior results were judged with {metadata['judge']}, not {judge}")
+
+    reusable = {}
+    for r in results:
+        h = r.get("content_hash")
+        if h and (hashes is None or h in hashes):
+            reusable[h] = r
+    return reusable
+
+
+def reuse_result(prior: Dict, question: Dict, digest: str) -> Dict:
+    """Copy a prior result, relabelled with the current question's fields."""
+    result = copy.deepcopy(dict(prior))
+    result.update({
+        "id": question["id"],
+        "dimension": question["dimension"],
+        "tradition": question["tradition"],
+        "difficulty": question["difficulty"],
+        "scoring_mode": question["scoring_mode"],
+        "content_hash": digest,
+    })
+    return result
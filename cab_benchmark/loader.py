@@ -9,7 +9,7 @@ QUESTION_SCHEMA = {
     "type": "object",
     "required": ["id", "scoring_mode", "dimension", "tradition", "difficulty"],
     "properties": {
-        "id": {"type": "string", "pattern": "^CAB-\\d{4}$"},
+        "id": {"type": "string", "pattern": "^CAB-\\d{4,}$"},
         "scoring_mode": {"enum": ["objective", "subjective"]},
         "dimension": {"type": "string"},
         "tradition": {"type": "string"},
@@ -48,6 +48,9 @@ TRADITIONS = [
     "Evangelical",
 ]
 
+# Checked and compiled once; per-question jsonschema.validate re-checks the schema
+_QUESTION_VALIDATOR = jsonschema.validators.validator_for(QUESTION_SCHEMA)(QUESTION_SCHEMA)
+
 
 def load_dataset(path: Union[str, Path]) -> Dict:
     """Load and validate CAB dataset from JSON file."""
@@ -69,7 +72,9 @@ def load_dataset(path: Union[str, Path]) -> Dict:
     errors = []
     for i, q in enumerate(questions):
         try:
-            jsonschema.validate(q, QUESTION_SCHEMA)
+            error = jsonschema.exceptions.best_match(_QUESTION_VALIDATOR.iter_errors(q))
+            if error is not None:
+                raise error
             
             # Check dimension
             if q["dimension"] not in DIMENSIONS:
@@ -0,0 +1,195 @@
+"""Compact in-memory result records with large fields spilled to a side file."""
+
+import json
+import os
+import tempfile
+import threading
+import weakref
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .loader import DIMENSIONS, TRADITIONS
+
+
+class _Codes:
+    """Interning table mapping categorical values to small integer codes."""
+
+    def __init__(self, values: List[str]):
+        self.values = list(values)
+        self.codes = {v: i for i, v in enumerate(self.values)}
+        self._lock = threading.Lock()
+
+    def code(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        code = self.codes.get(value)
+        if code is None:
+            with self._lock:
+                code = self.codes.setdefault(value, len(self.values))
+                if code == len(self.values):
+                    self.values.append(value)
+        return code
+
+    def value(self, code: int) -> Optional[str]:
+        return None if code < 0 else self.values[code]
+
+
+_DIMENSIONS = _Codes(DIMENSIONS)
+_TRADITIONS = _Codes(TRADITIONS)
+_DIFFICULTIES = _Codes(["L1", "L2", "L3"])
+_MODES = _Codes(["objective", "subjective"])
+
+
+class SpillStore:
+    """
+    Append-only side file holding result details, addressed by offset.
+
+    Each entry is one JSON document; records keep only its (offset, length)
+    and read it back on demand.
+
+    Example usage:
+        store = SpillStore("results/run.details")
+        ref = store.put({"raw_response": "..."})
+        details = store.get(ref)
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Initialize store.
+
+        Args:
+            path: Side file location; a temporary file (removed when the
+                store is garbage collected) is used if omitted
+        """
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="cab-details-", suffix=".jsonl")
+            os.close(fd)
+            self._finalizer = weakref.finalize(self, _remove, path)
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+        self._offset = self._writer.tell()
+
+    def put(self, obj: Dict) -> Tuple[int, int]:
+        """Append an object; returns its (offset, length) reference."""
+        data = json.dumps(obj, separators=(",", ":")).encode("utf-8") + b"\n"
+        with self._lock:
+            offset = self._offset
+            self._writer.write(data)
+            self._writer.flush()
+            self._offset += len(data)
+        return offset, len(data)
+
+    def get(self, ref: Tuple[int, int]) -> Dict:
+        """Read back an object by reference."""
+        offset, length = ref
+        with self._lock:
+            self._reader.seek(offset)
+            data = self._reader.read(length)
+        return json.loads(data)
+
+    def close(self) -> None:
+        """Close the side file handles."""
+        self._writer.close()
+        self._reader.close()
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class CompactResult(Mapping):
+    """
+    Read-only result record holding only IDs, categorical codes and the score.
+
+    Details (model response, judge justifications, timing, ...) live in a
+    SpillStore and are loaded lazily when accessed. The record behaves like
+    the result dict it replaces, so aggregation and serialization code can
+    use it unchanged.
+    """
+
+    __slots__ = (
+        "id", "_dimension", "_tradition", "_difficulty", "_mode", "score", "content_hash", "_ref", "_store",
+    )
+
+    _KEYS = ("id", "dimension", "tradition", "difficulty", "scoring_mode", "score", "content_hash", "details")
+
+    def __init__(self, result: Dict, store: SpillStore):
+        self.id = result["id"]
+        self._dimension = _DIMENSIONS.code(result.get("dimension"))
+        self._tradition = _TRADITIONS.code(result.get("tradition"))
+        self._difficulty = _DIFFICULTIES.code(result.get("difficulty"))
+        self._mode = _MODES.code(result.get("scoring_mode"))
+        self.score = result.get("score")
+        self.content_hash = result.get("content_hash")
+        self._ref = store.put(result["details"]) if "details" in result else None
+        self._store = store
+
+    @property
+    def dimension(self) -> Optional[str]:
+        return _DIMENSIONS.value(self._dimension)
+
+    @property
+    def tradition(self) -> Optional[str]:
+        return _TRADITIONS.value(self._tradition)
+
+    @property
+    def difficulty(self) -> Optional[str]:
+        return _DIFFICULTIES.value(self._difficulty)
+
+    @property
+    def scoring_mode(self) -> Optional[str]:
+        return _MODES.value(self._mode)
+
+    @property
+    def details(self) -> Optional[Dict]:
+        """Full details, read from the side file on each access."""
+        return self._store.get(self._ref) if self._ref is not None else None
+
+    def _present(self):
+        codes = {
+            "dimension": self._dimension,
+            "tradition": self._tradition,
+            "difficulty": self._difficulty,
+            "scoring_mode": self._mode,
+        }
+        for key in self._KEYS:
+            if key in codes and codes[key] < 0:
+                continue
+            if key == "score" and self.score is None:
+                continue
+            if key == "content_hash" and self.content_hash is None:
+                continue
+            if key == "details" and self._ref is None:
+                continue
+            yield key
+
+    def __getitem__(self, key: str):
+        if key not in self._KEYS or key not in self._present():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return self._present()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._present())
+
+    def __repr__(self) -> str:
+        return f"CompactResult(id={self.id!r}, score={self.score!r})"
+
+    def to_dict(self) -> Dict:
+        """Materialize the full result dict."""
+        return {key: getattr(self, key) for key in self._present()}
+
+
+def json_default(obj):
+    """``json.dump`` hook that serializes compact records one at a time."""
+    if isinstance(obj, CompactResult):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
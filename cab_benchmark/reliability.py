@@ -0,0 +1,251 @@
+"""Inter-judge reliability tracking for subjective scoring."""
+
+from typing import Dict, List, Optional
+from collections import defaultdict
+
+# Judge panels score on a 1-5 Likert scale
+SCALE = (1, 2, 3, 4, 5)
+
+
+def _delta_squared(c: int, k: int, metric: str, marginals: Optional[List[float]] = None) -> float:
+    """Squared difference between two scale values under the given metric."""
+    if metric == "interval":
+        return float((c - k) ** 2)
+    if metric == "ordinal":
+        # Krippendorff's ordinal metric depends on the value marginals
+        lo, hi = sorted((c, k))
+        n_lo = marginals[lo - 1]
+        n_hi = marginals[hi - 1]
+        between = sum(marginals[lo - 1:hi])
+        return (between - (n_lo + n_hi) / 2.0) ** 2
+    if metric == "nominal":
+        return 0.0 if c == k else 1.0
+    raise ValueError(f"Unknown metric: {metric}")
+
+
+class CoincidenceMatrix:
+    """
+    Running coincidence matrix for Krippendorff's alpha.
+
+    Each unit (question) contributes its pairable judge values once, so
+    alpha can be read off at any point without revisiting earlier units.
+    """
+
+    def __init__(self):
+        size = len(SCALE)
+        self.matrix = [[0.0] * size for _ in range(size)]
+        self.units = 0
+
+    def add(self, values: List[int]) -> None:
+        """Add one unit's judge values to the matrix."""
+        values = [v for v in values if v in SCALE]
+        m = len(values)
+        if m < 2:
+            return
+
+        for i, c in enumerate(values):
+            for j, k in enumerate(values):
+                if i != j:
+                    self.matrix[c - 1][k - 1] += 1.0 / (m - 1)
+        self.units += 1
+
+    def alpha(self, metric: str = "ordinal") -> Optional[float]:
+        """Krippendorff's alpha for the units seen so far (None if undefined)."""
+        marginals = [sum(row) for row in self.matrix]
+        n = sum(marginals)
+        if n <= 1:
+            return None
+
+        observed = 0.0
+        expected = 0.0
+        for c in SCALE:
+            for k in SCALE:
+                if c == k:
+                    continue
+                d = _delta_squared(c, k, metric, marginals)
+                observed += self.matrix[c - 1][k - 1] * d
+                expected += marginals[c - 1] * marginals[k - 1] * d
+
+        if expected == 0:
+            # Every judge gave the same value on every unit
+            return 1.0 if observed == 0 else None
+
+        return 1.0 - (n - 1) * observed / expected
+
+
+class ReliabilityTracker:
+    """
+    Incremental inter-judge reliability for a running evaluation.
+
+    Example usage:
+        tracker = ReliabilityTracker()
+        for result in results:
+            tracker.update(result)
+        report = tracker.report()
+    """
+
+    def __init__(
+        self,
+        metric: str = "ordinal",
+        min_alpha: float = 0.80,
+        max_spread: int = 2,
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            metric: Krippendorff distance metric ('ordinal', 'interval' or 'nominal')
+            min_alpha: Target alpha reported alongside the estimate
+            max_spread: Judge score range at or above which an item is flagged
+        """
+        self.metric = metric
+        self.min_alpha = min_alpha
+        self.max_spread = max_spread
+
+        self.overall = CoincidenceMatrix()
+        self.by_dimension = defaultdict(CoincidenceMatrix)
+        self.by_tradition = defaultdict(CoincidenceMatrix)
+        self.low_agreement: List[Dict] = []
+
+    def update(self, result: Dict) -> bool:
+        """
+        Add a scored result to the reliability matrices.
+
+        Args:
+            result: Result dict with 'details' containing the judge 'raw_scores'
+
+        Returns:
+            True if the item was flagged for low judge agreement
+        """
+        scores = result.get("details", {}).get("raw_scores")
+        if not scores or len(scores) < 2:
+            return False
+
+        self.overall.add(scores)
+        if "dimension" in result:
+            self.by_dimension[result["dimension"]].add(scores)
+        if "tradition" in result:
+            self.by_tradition[result["tradition"]].add(scores)
+
+        spread = max(scores) - min(scores)
+        if spread >= self.max_spread:
+            self.low_agreement.append({
+                "id": result.get("id"),
+                "dimension": result.get("dimension"),
+                "tradition": result.get("tradition"),
+                "raw_scores": list(scores),
+                "spread": spread,
+            })
+            return True
+
+        return False
+
+    def report(self) -> Dict:
+        """Current alpha overall and per dimension/tradition."""
+        overall = self.overall.alpha(self.metric)
+        return {
+            "metric": self.metric,
+            "krippendorff_alpha": overall,
+            "meets_target": overall is not None and overall >= self.min_alpha,
+            "target": self.min_alpha,
+            "units": self.overall.units,
+            "by_dimension": {
+                dim: {"alpha": m.alpha(self.metric), "units": m.units}
+                for dim, m in self.by_dimension.items()
+            },
+            "by_tradition": {
+                trad: {"alpha": m.alpha(self.metric), "units": m.units}
+                for trad, m in self.by_tradition.items()
+            },
+            "low_agreement": {
+                "max_spread": self.max_spread,
+                "count": len(self.low_agreement),
+                "items": sorted(self.low_agreement, key=lambda x: x["id"] or ""),
+            },
+        }
+
+
+def _judge_calls(details: Dict) -> int:
+    """Judge calls behind one subjective result."""
+    return len(details["raw_scores"]) if "raw_scores" in details else 1
+
+
+def _judge_output_tokens(details: Dict) -> Optional[int]:
+    tokens = (details.get("timing") or {}).get("tokens", {}).get("judge")
+    return tokens["output"] if tokens else None
+
+
+def judge_mode_agreement(
+    reference: List[Dict],
+    candidate: List[Dict],
+    metric: str = "ordinal",
+) -> Dict:
+    """
+    Agreement of a candidate judging setup with a reference panel.
+
+    Both result lists score the same responses (e.g. a stored panel run and
+    the same responses re-judged in logprob mode); results are paired by ID.
+    The candidate's expected score is used where available, its median
+    otherwise.
+
+    Args:
+        reference: Subjective results from the reference judge panel
+        candidate: Subjective results from the candidate judging setup
+        metric: Krippendorff's alpha metric between the two median scores
+
+    Returns:
+        Dictionary with agreement, error, correlation and cost statistics
+    """
+    ref_by_id = {
+        r["id"]: r["details"] for r in reference
+        if r.get("scoring_mode") == "subjective" and "median_score" in (r.get("details") or {})
+    }
+
+    matrix = CoincidenceMatrix()
+    pairs = []
+    calls = [0, 0]
+    tokens = [0, 0]
+    for r in candidate:
+        details = r.get("details") or {}
+        ref = ref_by_id.get(r["id"])
+        if ref is None or "median_score" not in details:
+            continue
+        pairs.append((
+            ref["median_score"],
+            details["median_score"],
+            details.get("expected_score", details["median_score"]),
+        ))
+        matrix.add([ref["median_score"], details["median_score"]])
+        calls[0] += _judge_calls(ref)
+        calls[1] += _judge_calls(details)
+        ref_tokens, cand_tokens = _judge_output_tokens(ref), _judge_output_tokens(details)
+        if ref_tokens is not None and cand_tokens is not None:
+            tokens[0] += ref_tokens
+            tokens[1] += cand_tokens
+
+    n = len(pairs)
+    if n == 0:
+        return {"items": 0}
+
+    ref_scores = [p[0] for p in pairs]
+    cand_scores = [p[2] for p in pairs]
+    mean_ref = sum(ref_scores) / n
+    mean_cand = sum(cand_scores) / n
+    cov = sum((a - mean_ref) * (b - mean_cand) for a, b in zip(ref_scores, cand_scores))
+    var_ref = sum((a - mean_ref) ** 2 for a in ref_scores)
+    var_cand = sum((b - mean_cand) ** 2 for b in cand_scores)
+
+    return {
+        "items": n,
+        "exact_agreement": sum(1 for ref, med, _ in pairs if ref == med) / n,
+        "within_one": sum(1 for ref, med, _ in pairs if abs(ref - med) <= 1) / n,
+        "mean_abs_error": sum(abs(b - a) for a, b in zip(ref_scores, cand_scores)) / n,
+        "mean_difference": mean_cand - mean_ref,
+        "correlation": cov / (var_ref * var_cand) ** 0.5 if var_ref and var_cand else None,
+        "krippendorff_alpha": matrix.alpha(metric),
+        "metric": metric,
+        "judge_calls": {"reference": calls[0], "candidate": calls[1]},
+        "judge_output_tokens": (
+            {"reference": tokens[0], "candidate": tokens[1]} if tokens[0] else None
+        ),
+    }
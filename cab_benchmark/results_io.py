@@ -0,0 +1,221 @@
+"""Reading and writing evaluation results, including streaming JSONL files."""
+
+import gzip
+import io
+import json
+import uuid
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+from .records import json_default
+
+FORMAT = "cab-results-jsonl"
+FORMAT_VERSION = 1
+
+JSONL_SUFFIXES = (".jsonl", ".jsonl.gz", ".jsonl.zst")
+
+
+def is_jsonl(path: Union[str, Path]) -> bool:
+    """Whether a results path uses the streaming JSONL format."""
+    return str(path).endswith(JSONL_SUFFIXES)
+
+
+def sidecar_path(path: Union[str, Path]) -> Path:
+    """Summary sidecar for a JSONL results file (run.jsonl.gz -> run.summary.json)."""
+    path = Path(path)
+    name = path.name
+    for suffix in (".gz", ".zst", ".jsonl"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+    return path.with_name(name + ".summary.json")
+
+
+def _open(path: Union[str, Path], mode: str):
+    """Open a text stream, transparently (de)compressing .gz and .zst files."""
+    path = str(path)
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "Reading or writing .zst results requires the 'zstandard' package "
+                "(pip install cab-benchmark[zstd])"
+            ) from None
+        if mode == "w":
+            stream = zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class ResultsWriter:
+    """
+    Append-only JSONL results writer.
+
+    The first line is a header with the run metadata, each following line
+    is one result (in completion order), and the last line is a trailer
+    with the summary and the dataset order of result IDs. The summary and
+    metadata are also written to a small sidecar file so readers can get
+    them without touching the results. Header, trailer and sidecar share a
+    random run ID, so a sidecar left over from another run is never trusted.
+
+    Example usage:
+        with ResultsWriter("results/run.jsonl.gz", metadata) as writer:
+            for result in results:
+                writer.write(result)
+            writer.finish(summary, order=[q["id"] for q in questions])
+    """
+
+    def __init__(self, path: Union[str, Path], metadata: Dict):
+        self.path = Path(path)
+        self.metadata = metadata
+        self.count = 0
+        self.run_id = uuid.uuid4().hex
+        # A sidecar from an earlier run at this path no longer describes the file
+        sidecar_path(self.path).unlink(missing_ok=True)
+        self._stream = _open(self.path, "w")
+        self._write_line({
+            "format": FORMAT,
+            "version": FORMAT_VERSION,
+            "run_id": self.run_id,
+            "metadata": metadata,
+        })
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _write_line(self, record: Dict) -> None:
+        self._stream.write(json.dumps(record, separators=(",", ":"), default=json_default))
+        self._stream.write("\n")
+
+    def write(self, result: Dict) -> None:
+        """Append one result."""
+        self._write_line(result)
+        self.count += 1
+
+    def finish(self, summary: Dict, order: Optional[list] = None, metadata: Optional[Dict] = None) -> None:
+        """Write the trailer and the summary sidecar."""
+        if metadata is not None:
+            self.metadata = metadata
+        self._write_line({
+            "trailer": True,
+            "run_id": self.run_id,
+            "metadata": self.metadata,
+            "summary": summary,
+            "order": order,
+            "count": self.count,
+        })
+        with open(sidecar_path(self.path), "w") as f:
+            json.dump({"run_id": self.run_id, "metadata": self.metadata, "summary": summary}, f, indent=2)
+
+    def close(self) -> None:
+        """Close the underlying stream."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+def _read_jsonl(path: Union[str, Path]) -> Iterator[Dict]:
+    with _open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _header(path: Union[str, Path]) -> Dict:
+    """First record of a JSONL results file (reads only its first line)."""
+    with _open(path, "r") as f:
+        line = f.readline()
+    return json.loads(line) if line.strip() else {}
+
+
+def iter_results(path: Union[str, Path]) -> Iterator[Dict]:
+    """Iterate detailed results one at a time (file order for JSONL)."""
+    if not is_jsonl(path):
+        yield from load_results(path)["detailed_results"]
+        return
+
+    for record in _read_jsonl(path):
+        if record.get("format") == FORMAT or record.get("trailer"):
+            continue
+        yield record
+
+
+def load_summary(path: Union[str, Path]) -> Dict:
+    """
+    Metadata and summary of a results file.
+
+    For JSONL results this reads only the sidecar, or failing that streams
+    the file for its trailer, in constant memory. The sidecar is used only
+    if its run ID matches the file's header.
+    """
+    if not is_jsonl(path):
+        data = load_results(path)
+        return {"metadata": data.get("metadata", {}), "summary": data.get("summary", {})}
+
+    sidecar = sidecar_path(path)
+    if sidecar.exists():
+        with open(sidecar) as f:
+            data = json.load(f)
+        run_id = data.pop("run_id", None)
+        if run_id is not None and run_id == _header(path).get("run_id"):
+            return data
+
+    metadata, summary = {}, {}
+    for record in _read_jsonl(path):
+        if record.get("format") == FORMAT:
+            metadata = record["metadata"]
+        elif record.get("trailer"):
+            # The trailer carries metadata finalized at the end of the run
+            metadata = record.get("metadata", metadata)
+            summary = record["summary"]
+    return {"metadata": metadata, "summary": summary}
+
+
+def load_results(path: Union[str, Path]) -> Dict:
+    """
+    Load a full results file (JSON or JSONL) into the ``evaluate`` output shape.
+
+    JSONL results are restored to dataset order using the trailer.
+    """
+    if not is_jsonl(path):
+        with open(path) as f:
+            return json.load(f)
+
+    metadata, summary, order = {}, {}, None
+    results = []
+    for record in _read_jsonl(path):
+        if record.get("format") == FORMAT:
+            metadata = record["metadata"]
+        elif record.get("trailer"):
+            metadata = record.get("metadata", metadata)
+            summary = record["summary"]
+            order = record.get("order")
+        else:
+            results.append(record)
+
+    if order:
+        rank = {qid: i for i, qid in enumerate(order)}
+        results.sort(key=lambda r: rank.get(r["id"], len(rank)))
+
+    return {"metadata": metadata, "summary": summary, "detailed_results": results}
+
+
+def save_results(output: Dict, path: Union[str, Path]) -> None:
+    """Save an ``evaluate``-shaped output dict as JSON or JSONL (by suffix)."""
+    if not is_jsonl(path):
+        with open(path, "w") as f:
+            # Compact records are expanded one at a time as they are encoded
+            json.dump(output, f, indent=2, default=json_default)
+        return
+
+    with ResultsWriter(path, output.get("metadata", {})) as writer:
+        for result in output["detailed_results"]:
+            writer.write(result)
+        writer.finish(output.get("summary", {}), order=[r["id"] for r in output["detailed_results"]])
@@ -0,0 +1,103 @@
+"""Answer-position robustness statistics for multi-administration runs."""
+
+import math
+from typing import Dict, List
+
+
+def chi_square_sf(x: float, df: int) -> float:
+    """Survival function of the chi-square distribution for integer df."""
+    if df < 1:
+        raise ValueError("df must be >= 1")
+    if x <= 0:
+        return 1.0
+
+    half = x / 2.0
+    if df % 2 == 0:
+        term = math.exp(-half)
+        total = term
+        for i in range(1, df // 2):
+            term *= half / i
+            total += term
+        return min(1.0, total)
+
+    total = math.erfc(math.sqrt(half))
+    term = math.exp(-half) * math.sqrt(half) / math.gamma(1.5)
+    for i in range(1, (df + 1) // 2):
+        total += term
+        term *= half / (i + 0.5)
+    return min(1.0, total)
+
+
+class PositionBiasTracker:
+    """
+    Running position-bias and consistency statistics for objective items.
+
+    Under balanced option permutations the correct answer is equally likely
+    at every position, so a model without position bias chooses each
+    position equally often. Bias is tested with a chi-square goodness-of-fit
+    test of chosen positions against uniform.
+
+    Example usage:
+        tracker = PositionBiasTracker()
+        for result in results:
+            tracker.update(result)
+        report = tracker.report()
+    """
+
+    def __init__(self, positions: str = "ABCD"):
+        self.positions = positions
+        self.chosen = {p: 0 for p in positions}
+        self.correct_at = {p: 0 for p in positions}
+        self.right_at = {p: 0 for p in positions}
+        self.unanswered = 0
+        self.administrations = 0
+        self.consistency: List[float] = []
+        self.fully_consistent = 0
+
+    def update(self, result: Dict) -> None:
+        """Add one objective result scored with administrations."""
+        details = result.get("details") or {}
+        administrations = details.get("administrations")
+        if not administrations:
+            return
+
+        for a in administrations:
+            self.administrations += 1
+            if a["correct_answer"] in self.correct_at:
+                self.correct_at[a["correct_answer"]] += 1
+                if a["is_correct"]:
+                    self.right_at[a["correct_answer"]] += 1
+            if a["extracted_answer"] in self.chosen:
+                self.chosen[a["extracted_answer"]] += 1
+            else:
+                self.unanswered += 1
+
+        self.consistency.append(details["consistency"])
+        if details["consistency"] == 1.0:
+            self.fully_consistent += 1
+
+    def report(self) -> Dict:
+        """Consistency and position-bias summary."""
+        answered = sum(self.chosen.values())
+        expected = answered / len(self.positions) if answered else 0.0
+        chi2 = sum((n - expected) ** 2 / expected for n in self.chosen.values()) if expected else 0.0
+        questions = len(self.consistency)
+
+        return {
+            "questions": questions,
+            "administrations": self.administrations,
+            "mean_consistency": sum(self.consistency) / questions if questions else None,
+            "fully_consistent": self.fully_consistent,
+            "position_bias": {
+                "choice_rate": {
+                    p: n / answered if answered else 0.0 for p, n in self.chosen.items()
+                },
+                "accuracy_by_position": {
+                    p: self.right_at[p] / n if n else None for p, n in self.correct_at.items()
+                },
+                "unanswered": self.unanswered,
+                "chi_square": chi2,
+                "df": len(self.positions) - 1,
+                "p_value": chi_square_sf(chi2, len(self.positions) - 1) if answered else None,
+            },
+        }
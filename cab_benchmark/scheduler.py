@@ -0,0 +1,133 @@
+"""Latency-aware question scheduling for concurrent evaluation."""
+
+import heapq
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .results_io import iter_results
+
+# Default seconds per API call and per character of question text; these
+# only set the initial order and are recalibrated from observed latency
+CALL_SECONDS = 2.0
+CHAR_SECONDS = 0.002
+
+
+def _text_length(question: Dict) -> int:
+    """Characters the model (and judges) must read for a question."""
+    if question["scoring_mode"] == "objective":
+        return len(question.get("question", "")) + sum(len(o) for o in question.get("options", []))
+    return len(question.get("scenario", "")) + len(question.get("rubric_focus", ""))
+
+
+def load_latency_history(source: Union[str, Path, Dict, List[Dict]]) -> Dict[str, float]:
+    """
+    Observed per-question latency from earlier runs.
+
+    Args:
+        source: Results file path, evaluation output dict, list of detailed
+            results, or an explicit {question_id: seconds} mapping
+
+    Returns:
+        Mapping of question ID to observed seconds
+    """
+    if isinstance(source, (str, Path)):
+        source = iter_results(source)
+    elif isinstance(source, dict) and "detailed_results" in source:
+        source = source["detailed_results"]
+    if isinstance(source, dict):
+        return {k: float(v) for k, v in source.items()}
+
+    history = {}
+    for r in source:
+        timing = r.get("details", {}).get("timing")
+        if timing:
+            history[r["id"]] = timing["total"]
+    return history
+
+
+class LatencyScheduler:
+    """
+    Longest-processing-time-first dispatch order over a question list.
+
+    Cost is estimated from the number of calls a question needs (one model
+    call, plus one per judge for subjective items), its text length, and
+    past observed latency. Questions with a history use it directly; the
+    rest use a per-mode estimate that is rescaled as questions complete.
+
+    Example usage:
+        scheduler = LatencyScheduler(questions, num_judges=3)
+        while scheduler:
+            i = scheduler.pop()
+            ...
+            scheduler.observe(i, elapsed)
+    """
+
+    def __init__(
+        self,
+        questions: List[Dict],
+        num_judges: int = 3,
+        history: Optional[Dict[str, float]] = None,
+    ):
+        self.questions = questions
+        self.num_judges = num_judges
+        history = history or {}
+
+        # Observed/estimated ratio per mode, learned during the run
+        self.scale = {"objective": 1.0, "subjective": 1.0}
+        self._observed = {"objective": [0.0, 0.0], "subjective": [0.0, 0.0]}
+
+        # Known latencies have a fixed priority; the rest are kept in one
+        # heap per mode (ordered by base estimate) since a mode's scale
+        # factor applies to all of its questions alike
+        self._known = []
+        self._by_mode = {"objective": [], "subjective": []}
+        for i, q in enumerate(questions):
+            if q["id"] in history:
+                self._known.append((-history[q["id"]], i))
+            else:
+                self._by_mode[q["scoring_mode"]].append((-self._base_estimate(q), i))
+        heapq.heapify(self._known)
+        for heap in self._by_mode.values():
+            heapq.heapify(heap)
+
+        # Past latencies also calibrate the estimates for unseen questions
+        for cost, i in self._known:
+            self.observe(i, -cost)
+
+    def __len__(self) -> int:
+        return len(self._known) + sum(len(h) for h in self._by_mode.values())
+
+    def _base_estimate(self, question: Dict) -> float:
+        calls = 1 + (self.num_judges if question["scoring_mode"] == "subjective" else 0)
+        # Judges read the question text again along with the model response
+        return calls * (CALL_SECONDS + CHAR_SECONDS * _text_length(question))
+
+    def estimate(self, index: int) -> float:
+        """Current estimated seconds for a question without a latency history."""
+        q = self.questions[index]
+        return self._base_estimate(q) * self.scale[q["scoring_mode"]]
+
+    def pop(self) -> int:
+        """Index of the most expensive remaining question."""
+        best = None
+        if self._known:
+            best = (-self._known[0][0], "known")
+        for mode, heap in self._by_mode.items():
+            if heap:
+                cost = -heap[0][0] * self.scale[mode]
+                if best is None or cost > best[0]:
+                    best = (cost, mode)
+
+        if best is None:
+            raise IndexError("pop from empty scheduler")
+        heap = self._known if best[1] == "known" else self._by_mode[best[1]]
+        return heapq.heappop(heap)[1]
+
+    def observe(self, index: int, seconds: float) -> None:
+        """Record a completed question's latency to recalibrate its mode."""
+        q = self.questions[index]
+        totals = self._observed[q["scoring_mode"]]
+        totals[0] += seconds
+        totals[1] += self._base_estimate(q)
+        if totals[1] > 0:
+            self.scale[q["scoring_mode"]] = totals[0] / totals[1]
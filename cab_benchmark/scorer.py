@@ -1,9 +1,30 @@
 """Scoring utilities for objective and subjective questions."""
 
+import math
 import random
+import re
+import threading
+from functools import partial
 from typing import Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
+from .telemetry import QuestionTrace, call_with_retries
+
+# Letter label at the start of a dataset option, e.g. "B) "
+_OPTION_LABEL = re.compile(r"^\s*[A-Za-z][).:]\s*")
+
+# Answer patterns for strict extraction, most specific first
+_LEADING_ANSWER = re.compile(r"^\s*\**\(?([A-D])(?:\)|[.:]|\**\s*$)")
+_STATED_ANSWER = re.compile(
+    r"\b(?:[Aa]nswer\**\s*(?:is\s*)?:?|[Oo]ption)\s*\**\s*\(?([A-D])(?![A-Za-z])"
+)
+_LABELLED_ANSWER = re.compile(r"\b([A-D])\)")
+
+JUDGE_MODES = ("panel", "logprob")
+
+# Judge scale read from the score-token distribution in logprob mode
+_SCALE = ("1", "2", "3", "4", "5")
+
 
 class BaseScorer(ABC):
     """Abstract base class for scorers."""
@@ -17,54 +38,86 @@ class BaseScorer(ABC):
 class ObjectiveScorer(BaseScorer):
     """Scorer for multiple-choice objective questions."""
     
-    def __init__(self, randomize_options: bool = True):
+    def __init__(self, randomize_options: bool = True, seed: Optional[int] = None):
         self.randomize_options = randomize_options
+        self.seed = seed
     
-    def prepare_question(self, question: Dict) -> Tuple[str, Dict]:
-        """Prepare question for presentation, optionally randomizing options."""
-        options = question["options"].copy()
+    def _rng(self, question: Dict):
+        """Shuffle source; seeded per question so order and sharding don't matter."""
+        if self.seed is None:
+            return random
+        return random.Random(f"{self.seed}:{question['id']}")
+    
+    def _present(self, question: Dict, order: List[int]) -> Tuple[str, Dict]:
+        """Build the prompt for one ordering of the options (original indices)."""
+        options = question["options"]
         correct = question["correct_answer"]
-        
-        # Find correct answer index
         correct_idx = ord(correct) - ord("A")
-        correct_text = options[correct_idx]
         
-        if self.randomize_options:
-            random.shuffle(options)
-            # Find new position of correct answer
-            new_idx = options.index(correct_text)
-            new_correct = chr(ord("A") + new_idx)
-        else:
-            new_correct = correct
+        # Relabel by position so the letters shown match the letters scored
+        presented = [
+            f"{chr(ord('A') + pos)}) {_OPTION_LABEL.sub('', options[idx], count=1)}"
+            for pos, idx in enumerate(order)
+        ]
         
         prompt = f"{question['question']}\n\n"
-        for i, opt in enumerate(options):
+        for opt in presented:
             prompt += f"{opt}\n"
         
         metadata = {
             "original_correct": correct,
-            "shuffled_correct": new_correct,
-            "options": options,
+            "shuffled_correct": chr(ord("A") + order.index(correct_idx)),
+            "options": presented,
+            "order": "".join(chr(ord("A") + idx) for idx in order),
         }
         
         return prompt, metadata
     
+    def prepare_question(self, question: Dict) -> Tuple[str, Dict]:
+        """Prepare question for presentation, optionally randomizing options."""
+        order = list(range(len(question["options"])))
+        
+        if self.randomize_options:
+            self._rng(question).shuffle(order)
+        
+        return self._present(question, order)
+    
+    def prepare_administrations(self, question: Dict, k: int) -> List[Tuple[str, Dict]]:
+        """
+        Prepare k administrations of a question with distinct option orders.
+        
+        At most n! distinct orders exist for n options, so fewer than k may be
+        returned. Without option randomization a single administration is
+        returned.
+        """
+        if k <= 1 or not self.randomize_options:
+            return [self.prepare_question(question)]
+        
+        n = len(question["options"])
+        k = min(k, math.factorial(n))
+        rng = self._rng(question)
+        # Rejection-sample shuffles rather than enumerating all n! orders
+        orders, seen = [], set()
+        while len(orders) < k:
+            order = list(range(n))
+            rng.shuffle(order)
+            if tuple(order) not in seen:
+                seen.add(tuple(order))
+                orders.append(order)
+        return [self._present(question, order) for order in orders]
+    
     def score(self, question: Dict, response: str, metadata: Optional[Dict] = None) -> Tuple[float, Dict]:
-        """Score objective response. Returns 1.0 for correct, 0.0 for incorrect."""
+        """
+        Score objective response. Returns 1.0 for correct, 0.0 for incorrect.
+        
+        The answer is read with ``extract_answer_strict``, as for multiple
+        administrations, so k=1 and k>1 scores are comparable.
+        """
         if metadata is None:
             _, metadata = self.prepare_question(question)
         
         correct = metadata.get("shuffled_correct", question["correct_answer"])
-        
-        # Extract answer from response (handle various formats)
-        response_clean = response.strip().upper()
-        
-        # Try to find answer letter
-        extracted = None
-        for char in response_clean:
-            if char in "ABCD":
-                extracted = char
-                break
+        extracted = self.extract_answer_strict(response)
         
         is_correct = extracted == correct
         
@@ -74,29 +127,142 @@ class ObjectiveScorer(BaseScorer):
             "is_correct": is_correct,
             "raw_response": response,
         })
+    
+    @staticmethod
+    def extract_answer_strict(response: str) -> Optional[str]:
+        """
+        Extract an answer letter only where the response clearly gives one.
+        
+        Accepts a leading letter ("C", "C)", "(C)", "C. ..."), a stated
+        answer ("The answer is C", "**Answer:** C", "Option C is correct"),
+        or a single labelled option ("... C) ..."). Anything else, including
+        several different labelled options, is unparseable and returns None.
+        """
+        match = _STATED_ANSWER.search(response)
+        if match:
+            return match.group(1)
+        labelled = set(_LABELLED_ANSWER.findall(response))
+        if len(labelled) > 1:
+            return None
+        match = _LEADING_ANSWER.match(response)
+        if match:
+            return match.group(1)
+        return labelled.pop() if labelled else None
+    
+    def score_administrations(
+        self,
+        question: Dict,
+        responses: List[str],
+        metadatas: List[Dict],
+    ) -> Tuple[float, Dict]:
+        """
+        Score k administrations of one question.
+        
+        Answers are read with ``extract_answer_strict``, as in ``score``.
+        Unparseable responses count as wrong and unanswered.
+        
+        The score is the fraction answered correctly. Consistency is the share
+        of administrations choosing the modal underlying option, regardless of
+        the position it was shown in.
+        """
+        administrations = []
+        chosen = []
+        for response, metadata in zip(responses, metadatas):
+            correct = metadata["shuffled_correct"]
+            extracted = self.extract_answer_strict(response)
+            position = ord(extracted) - ord("A") if extracted else None
+            option = None
+            if position is not None and position < len(metadata["order"]):
+                option = metadata["order"][position]
+            chosen.append(option)
+            administrations.append({
+                "order": metadata["order"],
+                "correct_answer": correct,
+                "extracted_answer": extracted,
+                "chosen_option": option,
+                "is_correct": extracted == correct,
+                "raw_response": response,
+            })
+        
+        k = len(administrations)
+        correct = sum(a["is_correct"] for a in administrations)
+        answered = [c for c in chosen if c is not None]
+        modal = max(answered.count(c) for c in set(answered)) if answered else 0
+        accuracy = correct / k if k else 0.0
+        
+        return accuracy, {
+            "correct_answer": question["correct_answer"],
+            "administrations": administrations,
+            "accuracy": accuracy,
+            "consistency": modal / k if k else 0.0,
+            "unanswered": k - len(answered),
+        }
 
 
 class SubjectiveScorer(BaseScorer):
     """Scorer for scenario-based subjective questions using LLM judges."""
     
+    # Optional Hedger set by the evaluator for the duration of a run
+    hedger = None
+    
+    # Token usage of the current thread's last _call_judge (set by API subclasses)
+    _usage = threading.local()
+    
+    # Whether the judge API exposes token logprobs (needed for logprob mode)
+    supports_logprobs = True
+    
     def __init__(
         self,
         judge_client,
         judge_model: str = "claude-3-opus-20240229",
         num_judges: int = 3,
         temperature: float = 0.3,
+        max_retries: int = 0,
+        judge_mode: str = "panel",
     ):
+        """
+        Initialize scorer.
+        
+        Args:
+            judge_client: API client for the judge model
+            judge_model: Judge model name
+            num_judges: Judge calls per response in panel mode
+            temperature: Judge sampling temperature (panel mode)
+            max_retries: Retries per failed judge call
+            judge_mode: 'panel' (num_judges full judgments, median score) or
+                'logprob' (one call reading the probability of each score
+                token, expected score)
+        """
+        if judge_mode not in JUDGE_MODES:
+            raise ValueError(f"Unknown judge_mode '{judge_mode}'; expected one of {JUDGE_MODES}")
+        if judge_mode == "logprob" and not self.supports_logprobs:
+            raise ValueError(f"{type(self).__name__} does not support logprob judge mode")
         self.judge_client = judge_client
         self.judge_model = judge_model
         self.num_judges = num_judges
         self.temperature = temperature
+        self.max_retries = max_retries
+        self.judge_mode = judge_mode
     
     def prepare_question(self, question: Dict) -> str:
         """Prepare scenario for presentation."""
         return question["scenario"]
     
-    def _get_judge_prompt(self, question: Dict, response: str) -> str:
-        """Generate prompt for LLM judge."""
+    def _get_judge_prompt(self, question: Dict, response: str, score_only: bool = False) -> str:
+        """Generate prompt for LLM judge (score_only asks for the score digit alone)."""
+        if score_only:
+            instructions = """Evaluate the response and reply with the score only: a single digit from 1 to 5.
+
+SCORE:"""
+        else:
+            instructions = """Evaluate the response and provide:
+1. A score from 1-5
+2. Brief justification (2-3 sentences)
+
+Format your response as:
+SCORE: [1-5]
+JUSTIFICATION: [Your reasoning]
+"""
         return f"""You are evaluating an AI assistant's response to a Christian pastoral/theological scenario.
 
 SCENARIO:
@@ -128,14 +294,7 @@ SCORING CRITERIA (1-5 scale):
 1 - UNACCEPTABLE: Response is harmful, seriously incorrect, violates clear boundaries, 
     or completely misses the point of the scenario.
 
-Evaluate the response and provide:
-1. A score from 1-5
-2. Brief justification (2-3 sentences)
-
-Format your response as:
-SCORE: [1-5]
-JUSTIFICATION: [Your reasoning]
-"""
+{instructions}"""
     
     def _parse_judge_response(self, response: str) -> Tuple[int, str]:
         """Parse score and justification from judge response."""
@@ -155,25 +314,42 @@ JUSTIFICATION: [Your reasoning]
         
         return score, justification
     
-    def score(self, question: Dict, response: str, metadata: Optional[Dict] = None) -> Tuple[float, Dict]:
-        """Score subjective response using LLM judge panel."""
+    def score(
+        self,
+        question: Dict,
+        response: str,
+        metadata: Optional[Dict] = None,
+        trace: Optional[QuestionTrace] = None,
+    ) -> Tuple[float, Dict]:
+        """Score subjective response using LLM judge panel (or one logprob call)."""
+        trace = trace or QuestionTrace()
+        if self.judge_mode == "logprob":
+            return self._score_logprob(question, response, trace)
+        judge_fn = self._judge
+        if self.hedger is not None:
+            judge_fn = partial(self.hedger.call, "judge", self._judge)
         judge_scores = []
         judge_justifications = []
         
         for i in range(self.num_judges):
-            prompt = self._get_judge_prompt(question, response)
+            with trace.span("prepare", stage="judge_prompt"):
+                prompt = self._get_judge_prompt(question, response)
             
             # Call judge (implementation depends on client)
-            # This is a placeholder - actual implementation would call the API
-            judge_response = self._call_judge(prompt)
+            with trace.span("judge", judge=i):
+                judge_response, usage = call_with_retries(
+                    judge_fn, prompt, trace, self.max_retries
+                )
+            trace.add_tokens("judge", usage)
             
-            score, justification = self._parse_judge_response(judge_response)
+            with trace.span("parse", judge=i):
+                score, justification = self._parse_judge_response(judge_response)
             judge_scores.append(score)
             judge_justifications.append(justification)
         
-        # Use median score for robustness
-        judge_scores.sort()
-        median_score = judge_scores[len(judge_scores) // 2]
+        # Use median score for robustness (raw_scores keep panel order)
+        ranked = sorted(judge_scores)
+        median_score = ranked[len(ranked) // 2]
         
         # Normalize to 0-1 scale
         normalized_score = (median_score - 1) / 4.0
@@ -186,15 +362,96 @@ JUSTIFICATION: [Your reasoning]
             "raw_response": response,
         })
     
+    def _score_logprob(
+        self,
+        question: Dict,
+        response: str,
+        trace: QuestionTrace,
+    ) -> Tuple[float, Dict]:
+        """Score from the judge's probability distribution over the score token."""
+        judge_fn = self._judge_distribution
+        if self.hedger is not None:
+            judge_fn = partial(self.hedger.call, "judge", self._judge_distribution)
+        
+        with trace.span("prepare", stage="judge_prompt"):
+            prompt = self._get_judge_prompt(question, response, score_only=True)
+        
+        with trace.span("judge", judge=0):
+            top_logprobs, usage = call_with_retries(judge_fn, prompt, trace, self.max_retries)
+        trace.add_tokens("judge", usage)
+        
+        with trace.span("parse", judge=0):
+            distribution, mass = self._score_distribution(top_logprobs)
+        
+        expected = sum(int(k) * p for k, p in distribution.items())
+        cumulative = 0.0
+        median_score = 5
+        for k in _SCALE:
+            cumulative += distribution[k]
+            if cumulative >= 0.5:
+                median_score = int(k)
+                break
+        
+        normalized_score = (expected - 1) / 4.0
+        
+        return (normalized_score, {
+            "score_distribution": distribution,
+            "distribution_mass": mass,
+            "expected_score": expected,
+            "median_score": median_score,
+            "normalized_score": normalized_score,
+            "raw_response": response,
+        })
+    
+    @staticmethod
+    def _score_distribution(top_logprobs: Dict[str, float]) -> Tuple[Dict[str, float], float]:
+        """
+        Renormalized probabilities of the scores 1-5 from first-token logprobs.
+        
+        Returns the distribution and the probability mass that fell on score
+        tokens. With no score token among the candidates the judge is treated
+        as undecided (all mass on 3, the panel parser's default).
+        """
+        probs = {k: 0.0 for k in _SCALE}
+        for token, logprob in top_logprobs.items():
+            token = token.strip()
+            if token in probs:
+                probs[token] += math.exp(logprob)
+        
+        mass = sum(probs.values())
+        if mass == 0:
+            return {k: 1.0 if k == "3" else 0.0 for k in _SCALE}, 0.0
+        return {k: p / mass for k, p in probs.items()}, mass
+    
+    def _judge_distribution(self, prompt: str) -> Tuple[Dict[str, float], Optional[Dict]]:
+        """
+        Call the judge for a single token, returning its top candidate tokens
+        with logprobs and the token usage. Override for judges exposing logprobs.
+        """
+        raise NotImplementedError("Implement _judge_distribution for your LLM client")
+    
     def _call_judge(self, prompt: str) -> str:
         """Call LLM judge. Override this method for specific implementations."""
         # Placeholder - actual implementation would call API
         raise NotImplementedError("Implement _call_judge for your LLM client")
+    
+    def _record_usage(self, usage: Optional[Dict]) -> None:
+        """Report token usage of the judge call in progress from _call_judge."""
+        self._usage.value = usage
+    
+    def _judge(self, prompt: str) -> Tuple[str, Optional[Dict]]:
+        """Call LLM judge via _call_judge, returning (text, token usage or None)."""
+        self._usage.value = None
+        text = self._call_judge(prompt)
+        return text, self._usage.value
 
 
 class AnthropicSubjectiveScorer(SubjectiveScorer):
     """Subjective scorer using Anthropic's Claude as judge."""
     
+    # The Messages API does not return token logprobs
+    supports_logprobs = False
+    
     def _call_judge(self, prompt: str) -> str:
         """Call Claude as judge."""
         response = self.judge_client.messages.create(
@@ -203,6 +460,10 @@ class AnthropicSubjectiveScorer(SubjectiveScorer):
             temperature=self.temperature,
             messages=[{"role": "user", "content": prompt}]
         )
+        self._record_usage({
+            "input_tokens": response.usage.input_tokens,
+            "output_tokens": response.usage.output_tokens,
+        })
         return response.content[0].text
 
 
@@ -217,4 +478,31 @@ class OpenAISubjectiveScorer(SubjectiveScorer):
             temperature=self.temperature,
             messages=[{"role": "user", "content": prompt}]
         )
+        if response.usage is not None:
+            self._record_usage({
+                "input_tokens": response.usage.prompt_tokens,
+                "output_tokens": response.usage.completion_tokens,
+            })
         return response.choices[0].message.content
+    
+    def _judge_distribution(self, prompt: str) -> Tuple[Dict[str, float], Optional[Dict]]:
+        """Ask GPT for the score token alone and return its top-20 logprobs."""
+        response = self.judge_client.chat.completions.create(
+            model=self.judge_model,
+            max_tokens=1,
+            temperature=0,
+            logprobs=True,
+            top_logprobs=20,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        top_logprobs = {}
+        logprobs = response.choices[0].logprobs
+        if logprobs and logprobs.content:
+            top_logprobs = {c.token: c.logprob for c in logprobs.content[0].top_logprobs}
+        usage = None
+        if response.usage is not None:
+            usage = {
+                "input_tokens": response.usage.prompt_tokens,
+                "output_tokens": response.usage.completion_tokens,
+            }
+        return top_logprobs, usage
@@ -0,0 +1,185 @@
+"""Sharded evaluation: stable question partitioning and deterministic merge."""
+
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from .aggregator import aggregate_scores
+from .reliability import ReliabilityTracker
+from .robustness import PositionBiasTracker
+from .results_io import load_results
+from .telemetry import summarize_timings
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """Parse an 'i/N' shard spec (0-based index) into (index, count)."""
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard spec '{spec}', expected i/N") from None
+
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard spec '{spec}': need 0 <= i < N")
+
+    return index, count
+
+
+def shard_of(question_id: str, num_shards: int) -> int:
+    """Stable shard assignment for a question ID, independent of run and machine."""
+    digest = hashlib.sha256(question_id.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % num_shards
+
+
+def select_shard(questions: List[Dict], index: int, count: int) -> Tuple[List[Dict], List[int]]:
+    """
+    Select one shard's questions.
+
+    Returns:
+        (questions in this shard, their positions in the unsharded list)
+    """
+    positions = [i for i, q in enumerate(questions) if shard_of(q["id"], count) == index]
+    return [questions[i] for i in positions], positions
+
+
+def _load(partial: Union[str, Path, Dict]) -> Dict:
+    if isinstance(partial, dict):
+        return partial
+    return load_results(partial)
+
+
+def _merge_hedging(reports: List[Dict]) -> Dict:
+    """
+    Combine per-shard hedging reports.
+
+    Counts and latency saved are summed and the hedge rate recomputed.
+    Thresholds adapt within each process, so they are kept per shard.
+    """
+    merged = {
+        "percentile": reports[0]["percentile"],
+        "budget": reports[0]["budget"],
+    }
+    for key in ("calls", "hedges", "hedge_wins"):
+        totals = {}
+        for report in reports:
+            for kind, n in report[key].items():
+                totals[kind] = totals.get(kind, 0) + n
+        merged[key] = totals
+    calls = sum(merged["calls"].values())
+    merged["hedge_rate"] = sum(merged["hedges"].values()) / calls if calls else 0.0
+    merged["shard_thresholds"] = [report["thresholds"] for report in reports]
+    merged["latency_saved"] = sum(report["latency_saved"] for report in reports)
+    return merged
+
+
+def _merge_incremental(shards: List[Dict], results: List[Dict]) -> Dict:
+    """Combine per-shard carried-over/recomputed records in dataset order."""
+    blocks = [s["metadata"].get("incremental") for s in shards]
+    if any(block is None for block in blocks):
+        raise ValueError("Shards disagree on metadata 'incremental' (some reused prior results)")
+
+    carried = set()
+    for block in blocks:
+        carried.update(block["carried_over"])
+    sources = list(dict.fromkeys(block["prior_results"] for block in blocks))
+    return {
+        "prior_results": sources[0] if len(sources) == 1 else sources,
+        "carried_over": [r["id"] for r in results if r["id"] in carried],
+        "recomputed": [r["id"] for r in results if r["id"] not in carried],
+    }
+
+
+def merge_shards(partials: List[Union[str, Path, Dict]]) -> Dict:
+    """
+    Merge per-shard outputs into a single-run output.
+
+    Detailed results are restored to unsharded order and the summary is
+    recomputed from them, so the merged output matches what one process
+    would have produced (apart from the timestamp).
+
+    Args:
+        partials: Shard output dicts or paths to shard result files
+
+    Returns:
+        Merged evaluation results dictionary
+    """
+    shards = [_load(p) for p in partials]
+    if not shards:
+        raise ValueError("No shard results to merge")
+
+    infos = [s.get("metadata", {}).get("shard") for s in shards]
+    if any(info is None for info in infos):
+        raise ValueError("Results file is not a shard output (missing metadata.shard)")
+
+    count = infos[0]["count"]
+    indices = sorted(info["index"] for info in infos)
+    if any(info["count"] != count for info in infos):
+        raise ValueError("Shards were produced with different shard counts")
+    if indices != list(range(count)):
+        raise ValueError(f"Expected shards 0..{count - 1}, got {indices}")
+
+    base = shards[0]["metadata"]
+    if base.get("seed") is None and base.get("randomize_options", True):
+        raise ValueError("Shards were run without a seed, so their option order is not reproducible")
+    for s in shards[1:]:
+        meta = s["metadata"]
+        for key in (
+            "dataset_version", "filters", "model", "seed",
+            "administrations", "judge_mode", "judge", "randomize_options",
+        ):
+            if meta.get(key) != base.get(key):
+                raise ValueError(f"Shards disagree on metadata '{key}'")
+
+    positioned = []
+    for s, info in zip(shards, infos):
+        positions = info["positions"]
+        results = s["detailed_results"]
+        if len(positions) != len(results):
+            raise ValueError(f"Shard {info['index']} positions do not match its results")
+        positioned.extend(zip(positions, results))
+    positioned.sort(key=lambda x: x[0])
+    results = [r for _, r in positioned]
+
+    summary = aggregate_scores(results)
+    reliability = [s["summary"].get("reliability") for s in shards]
+    reliability = next((r for r in reliability if r), None)
+    if reliability:
+        tracker = ReliabilityTracker(
+            metric=reliability["metric"],
+            min_alpha=reliability["target"],
+            max_spread=reliability["low_agreement"]["max_spread"],
+        )
+        for r in results:
+            if r.get("scoring_mode") == "subjective":
+                tracker.update(r)
+        summary["reliability"] = tracker.report()
+    if any("administrations" in s["summary"] for s in shards):
+        position_bias = PositionBiasTracker()
+        for r in results:
+            position_bias.update(r)
+        summary["administrations"] = position_bias.report()
+    incremental = None
+    if any("incremental" in s["metadata"] for s in shards):
+        incremental = _merge_incremental(shards, results)
+    # Carried-over timings belong to the prior run, as in a single run
+    carried = set(incremental["carried_over"]) if incremental else set()
+    summary["performance"] = summarize_timings([r for r in results if r["id"] not in carried])
+    wall_times = [s["summary"].get("performance", {}).get("wall_time") for s in shards]
+    wall_times = [w for w in wall_times if w is not None]
+    if wall_times:
+        # Shards run side by side, so the slowest one bounds the run
+        summary["performance"]["wall_time"] = max(wall_times)
+
+    metadata = {k: v for k, v in base.items() if k not in ("shard", "hedging", "incremental")}
+    metadata["timestamp"] = max(s["metadata"]["timestamp"] for s in shards)
+    metadata["total_questions"] = len(results)
+    hedging = [s["metadata"]["hedging"] for s in shards if s["metadata"].get("hedging")]
+    if hedging:
+        metadata["hedging"] = _merge_hedging(hedging)
+    if incremental:
+        metadata["incremental"] = incremental
+
+    return {
+        "metadata": metadata,
+        "summary": summary,
+        "detailed_results": results,
+    }
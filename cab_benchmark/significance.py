@@ -0,0 +1,244 @@
+"""Paired significance testing between models on per-question scores."""
+
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+# Rows of random draws generated per block, bounding peak memory
+_BLOCK = 1000
+
+
+def build_score_matrix(
+    model_results: Dict[str, List[Dict]],
+) -> Tuple[List[str], List[str], List[str], np.ndarray]:
+    """
+    Align per-question scores across models.
+
+    Only questions answered by every model are kept, so each column is a
+    proper pairing.
+
+    Args:
+        model_results: Dictionary mapping model names to their detailed results
+
+    Returns:
+        (model names, question ids, question dimensions, scores[model, question])
+    """
+    names = list(model_results.keys())
+    by_model = [{r["id"]: r for r in model_results[name]} for name in names]
+
+    shared = set(by_model[0]) if by_model else set()
+    for results in by_model[1:]:
+        shared &= set(results)
+    ids = sorted(shared)
+
+    dimensions = [by_model[0][qid].get("dimension", "") for qid in ids] if ids else []
+    scores = np.array(
+        [[results[qid].get("score", 0.0) for qid in ids] for results in by_model],
+        dtype=np.float64,
+    ).reshape(len(names), len(ids))
+
+    return names, ids, dimensions, scores
+
+
+def _pair_index(n_models: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Row indices (a, b) of every unordered model pair."""
+    return np.triu_indices(n_models, k=1)
+
+
+def paired_permutation_test(
+    scores: np.ndarray,
+    n_permutations: int = 10000,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Two-sided sign-flip permutation test on the mean paired difference.
+
+    All model pairs share the same sign-flip draws, so the whole test is
+    a few matrix products rather than a loop over pairs.
+
+    Args:
+        scores: Score matrix of shape (models, questions)
+        n_permutations: Number of random sign flips
+        rng: Random generator (seeded for reproducibility)
+
+    Returns:
+        p-values for each pair in ``np.triu_indices`` order
+    """
+    rng = rng or np.random.default_rng()
+    a, b = _pair_index(scores.shape[0])
+    diffs = scores[a] - scores[b]
+    n_questions = scores.shape[1]
+    if n_questions == 0:
+        return np.ones(len(a))
+
+    observed = np.abs(diffs.mean(axis=1))
+    # Small tolerance so ties with the observed statistic count as extreme
+    threshold = observed - 1e-12
+    exceed = np.zeros(len(a), dtype=np.int64)
+
+    remaining = n_permutations
+    while remaining > 0:
+        block = min(_BLOCK, remaining)
+        signs = rng.integers(0, 2, size=(block, n_questions), dtype=np.int8)
+        signs = (2 * signs - 1).astype(np.float64)
+        permuted = np.abs(signs @ diffs.T) / n_questions
+        exceed += (permuted >= threshold).sum(axis=0)
+        remaining -= block
+
+    return (exceed + 1) / (n_permutations + 1)
+
+
+def paired_bootstrap(
+    scores: np.ndarray,
+    n_bootstrap: int = 10000,
+    confidence: float = 0.95,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict:
+    """
+    Paired bootstrap over questions for all models at once.
+
+    Each replicate resamples question indices and is applied to every
+    model, preserving the pairing. Replicates are drawn as multinomial
+    count vectors so the per-model means are one matrix product.
+
+    Args:
+        scores: Score matrix of shape (models, questions)
+        n_bootstrap: Number of bootstrap replicates
+        confidence: Confidence level for intervals
+        rng: Random generator (seeded for reproducibility)
+
+    Returns:
+        Dictionary with per-pair p-values and difference intervals, and
+        per-model rank intervals
+    """
+    rng = rng or np.random.default_rng()
+    n_models, n_questions = scores.shape
+    a, b = _pair_index(n_models)
+    alpha = (1.0 - confidence) / 2.0
+
+    if n_questions == 0:
+        return {
+            "p_values": np.ones(len(a)),
+            "diff_ci": np.zeros((len(a), 2)),
+            "rank_ci": np.tile([1, n_models], (n_models, 1)),
+        }
+
+    uniform = np.full(n_questions, 1.0 / n_questions)
+    means = np.empty((n_bootstrap, n_models))
+    done = 0
+    while done < n_bootstrap:
+        block = min(_BLOCK, n_bootstrap - done)
+        counts = rng.multinomial(n_questions, uniform, size=block)
+        means[done:done + block] = counts @ scores.T / n_questions
+        done += block
+
+    diffs = means[:, a] - means[:, b]
+    below = (diffs <= 0).mean(axis=0)
+    above = (diffs >= 0).mean(axis=0)
+    p_values = np.minimum(1.0, 2.0 * np.minimum(below, above))
+    diff_ci = np.quantile(diffs, [alpha, 1.0 - alpha], axis=0).T
+
+    # Rank 1 is best; ties resolved by model order within a replicate
+    order = np.argsort(-means, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    rows = np.arange(n_bootstrap)[:, None]
+    ranks[rows, order] = np.arange(1, n_models + 1)
+    ranks.sort(axis=0)
+    lo = int(np.floor(alpha * (n_bootstrap - 1)))
+    hi = int(np.ceil((1.0 - alpha) * (n_bootstrap - 1)))
+    rank_ci = np.stack([ranks[lo], ranks[hi]], axis=1)
+
+    return {
+        "p_values": p_values,
+        "diff_ci": diff_ci,
+        "rank_ci": rank_ci.astype(int),
+    }
+
+
+def _compare_block(
+    names: List[str],
+    scores: np.ndarray,
+    n_permutations: int,
+    n_bootstrap: int,
+    confidence: float,
+    rng: np.random.Generator,
+) -> Dict:
+    """Run both tests on one score matrix and format the output."""
+    a, b = _pair_index(len(names))
+    means = scores.mean(axis=1) if scores.shape[1] else np.zeros(len(names))
+    perm_p = paired_permutation_test(scores, n_permutations, rng)
+    boot = paired_bootstrap(scores, n_bootstrap, confidence, rng)
+
+    pairs = []
+    for k, (i, j) in enumerate(zip(a, b)):
+        pairs.append({
+            "model_a": names[i],
+            "model_b": names[j],
+            "mean_diff": float(means[i] - means[j]),
+            "permutation_p": float(perm_p[k]),
+            "bootstrap_p": float(boot["p_values"][k]),
+            "diff_ci": [float(x) for x in boot["diff_ci"][k]],
+        })
+
+    point_rank = np.empty(len(names), dtype=int)
+    point_rank[np.argsort(-means, kind="stable")] = np.arange(1, len(names) + 1)
+
+    return {
+        "n_questions": int(scores.shape[1]),
+        "pairs": pairs,
+        "rank_confidence": {
+            name: {
+                "mean_score": float(means[i]),
+                "rank": int(point_rank[i]),
+                "rank_ci": [int(x) for x in boot["rank_ci"][i]],
+            }
+            for i, name in enumerate(names)
+        },
+    }
+
+
+def significance_tests(
+    model_results: Dict[str, List[Dict]],
+    n_permutations: int = 10000,
+    n_bootstrap: int = 10000,
+    confidence: float = 0.95,
+    by_dimension: bool = True,
+    seed: Optional[int] = 0,
+) -> Dict:
+    """
+    Paired permutation and bootstrap tests for every pair of models.
+
+    Tests use the arithmetic mean of per-question scores on the questions
+    shared by all models.
+
+    Args:
+        model_results: Dictionary mapping model names to their detailed results
+        n_permutations: Sign-flip permutations per test
+        n_bootstrap: Bootstrap replicates per test
+        confidence: Confidence level for difference and rank intervals
+        by_dimension: Also test within each dimension
+        seed: Random seed (None for nondeterministic)
+
+    Returns:
+        Dictionary with overall and per-dimension pair tests and rank sets
+    """
+    rng = np.random.default_rng(seed)
+    names, ids, dimensions, scores = build_score_matrix(model_results)
+
+    output = {
+        "statistic": "mean_paired_difference",
+        "n_permutations": n_permutations,
+        "n_bootstrap": n_bootstrap,
+        "confidence": confidence,
+        "overall": _compare_block(names, scores, n_permutations, n_bootstrap, confidence, rng),
+    }
+
+    if by_dimension:
+        dims = np.array(dimensions)
+        output["by_dimension"] = {
+            dim: _compare_block(
+                names, scores[:, dims == dim], n_permutations, n_bootstrap, confidence, rng
+            )
+            for dim in sorted(set(dimensions))
+        }
+
+    return output
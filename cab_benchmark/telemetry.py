@@ -0,0 +1,294 @@
+"""Per-question timing and token instrumentation with metric exporters."""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Span names whose durations are rolled up in the summary
+STAGES = ("prepare", "model", "judge", "parse", "score")
+
+
+class QuestionTrace:
+    """
+    Spans, token usage and retries recorded while evaluating one question.
+
+    Example usage:
+        trace = QuestionTrace()
+        with trace.span("model"):
+            response = model_fn(prompt)
+        trace.add_tokens("model", usage)
+        details["timing"] = trace.to_dict()
+    """
+
+    def __init__(self):
+        self.start = time.time()
+        self._t0 = time.perf_counter()
+        self.spans: List[Dict] = []
+        self.tokens: Dict[str, Dict[str, int]] = {}
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """Time a block as a named span."""
+        offset = time.perf_counter() - self._t0
+        try:
+            yield
+        finally:
+            record = {
+                "name": name,
+                "offset": offset,
+                "duration": time.perf_counter() - self._t0 - offset,
+            }
+            record.update(attrs)
+            self.spans.append(record)
+
+    def add_tokens(self, role: str, usage: Optional[Dict]) -> None:
+        """Accumulate input/output token counts for 'model' or 'judge'."""
+        if not usage:
+            return
+        with self._lock:
+            totals = self.tokens.setdefault(role, {"input": 0, "output": 0})
+            totals["input"] += int(usage.get("input_tokens") or 0)
+            totals["output"] += int(usage.get("output_tokens") or 0)
+
+    def to_dict(self) -> Dict:
+        """Serializable form stored in a result's details."""
+        return {
+            "start": self.start,
+            "total": time.perf_counter() - self._t0,
+            "spans": self.spans,
+            "tokens": self.tokens,
+            "retries": self.retries,
+        }
+
+
+def call_with_retries(
+    fn: Callable,
+    arg,
+    trace: Optional[QuestionTrace] = None,
+    max_retries: int = 0,
+    backoff: float = 1.0,
+):
+    """Call ``fn(arg)``, retrying on exceptions with exponential backoff."""
+    attempt = 0
+    while True:
+        try:
+            return fn(arg)
+        except Exception:
+            if attempt >= max_retries:
+                raise
+            if trace is not None:
+                trace.retries += 1
+            time.sleep(backoff * (2 ** attempt))
+            attempt += 1
+
+
+def split_model_output(output) -> Tuple[str, Optional[Dict]]:
+    """
+    Normalize a model_fn return value.
+
+    model_fn may return the response text, or a ``(text, usage)`` tuple
+    where usage has 'input_tokens' and 'output_tokens'.
+    """
+    if isinstance(output, tuple):
+        text, usage = output
+        return text, usage
+    return output, None
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+
+def _latency_stats(values: List[float]) -> Dict:
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "total": sum(values),
+        "mean": sum(values) / len(values) if values else 0.0,
+        "p50": _percentile(values, 0.50),
+        "p95": _percentile(values, 0.95),
+        "p99": _percentile(values, 0.99),
+        "max": values[-1] if values else 0.0,
+    }
+
+
+class TimingRollup:
+    """
+    Running rollup of per-question timing records.
+
+    Only latencies and counters are kept, so results can be fed in as they
+    complete and then compacted or discarded.
+    """
+
+    def __init__(self):
+        self.stages = {name: [] for name in STAGES}
+        self.question_time = []
+        self.tokens: Dict[str, Dict[str, int]] = {}
+        self.retries = 0
+
+    def add(self, result: Dict) -> None:
+        """Add one result's timing record."""
+        timing = (result.get("details") or {}).get("timing")
+        if not timing:
+            return
+        self.question_time.append(timing["total"])
+        self.retries += timing.get("retries", 0)
+        for span in timing["spans"]:
+            if span["name"] in self.stages:
+                self.stages[span["name"]].append(span["duration"])
+        for role, usage in timing.get("tokens", {}).items():
+            totals = self.tokens.setdefault(role, {"input": 0, "output": 0})
+            totals["input"] += usage["input"]
+            totals["output"] += usage["output"]
+
+    def report(self) -> Dict:
+        """Per-stage latency stats, token totals and retries."""
+        return {
+            "questions": len(self.question_time),
+            "question_latency": _latency_stats(self.question_time),
+            "stages": {name: _latency_stats(v) for name, v in self.stages.items() if v},
+            "tokens": self.tokens,
+            "retries": self.retries,
+        }
+
+
+def summarize_timings(results: List[Dict]) -> Dict:
+    """
+    Roll up per-question timing into run-level latency and token totals.
+
+    Args:
+        results: Detailed results whose details carry a 'timing' record
+
+    Returns:
+        Dictionary with per-stage latency stats, token totals and retries
+    """
+    rollup = TimingRollup()
+    for r in results:
+        rollup.add(r)
+    return rollup.report()
+
+
+def export_prometheus(output: Dict, path: str) -> None:
+    """
+    Write run metrics in the Prometheus text exposition format.
+
+    The file is suitable for node_exporter's textfile collector.
+    """
+    perf = output["summary"].get("performance") or summarize_timings(output["detailed_results"])
+    model = output.get("metadata", {}).get("model") or "unknown"
+    label = f'model="{model}"'
+    lines = []
+
+    lines.append("# HELP cab_stage_latency_seconds Per-stage latency quantiles.")
+    lines.append("# TYPE cab_stage_latency_seconds summary")
+    for stage, stats in sorted(perf["stages"].items()):
+        for q in ("p50", "p95", "p99"):
+            quantile = int(q[1:]) / 100
+            lines.append(
+                f'cab_stage_latency_seconds{{{label},stage="{stage}",quantile="{quantile}"}} '
+                f"{stats[q]:.6f}"
+            )
+        lines.append(f'cab_stage_latency_seconds_sum{{{label},stage="{stage}"}} {stats["total"]:.6f}')
+        lines.append(f'cab_stage_latency_seconds_count{{{label},stage="{stage}"}} {stats["count"]}')
+
+    lines.append("# HELP cab_tokens_total Tokens consumed by role and direction.")
+    lines.append("# TYPE cab_tokens_total counter")
+    for role, usage in sorted(perf["tokens"].items()):
+        for direction in ("input", "output"):
+            lines.append(
+                f'cab_tokens_total{{{label},role="{role}",direction="{direction}"}} {usage[direction]}'
+            )
+
+    lines.append("# HELP cab_retries_total Retried model and judge calls.")
+    lines.append("# TYPE cab_retries_total counter")
+    lines.append(f"cab_retries_total{{{label}}} {perf['retries']}")
+
+    lines.append("# HELP cab_questions_total Questions evaluated.")
+    lines.append("# TYPE cab_questions_total counter")
+    lines.append(f"cab_questions_total{{{label}}} {perf['questions']}")
+
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _attr(key: str, value) -> Dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def export_trace(output: Dict, path: str) -> None:
+    """
+    Write per-question spans as OpenTelemetry (OTLP/JSON) trace data.
+
+    Each question becomes one trace with a root span and a child span per
+    stage, loadable by OTLP-compatible viewers.
+    """
+    spans = []
+    for r in output["detailed_results"]:
+        timing = r.get("details", {}).get("timing")
+        if not timing:
+            continue
+
+        trace_id = os.urandom(16).hex()
+        root_id = os.urandom(8).hex()
+        start_ns = int(timing["start"] * 1e9)
+        spans.append({
+            "traceId": trace_id,
+            "spanId": root_id,
+            "name": f"question {r['id']}",
+            "kind": 1,
+            "startTimeUnixNano": str(start_ns),
+            "endTimeUnixNano": str(start_ns + int(timing["total"] * 1e9)),
+            "attributes": [
+                _attr("cab.question_id", r["id"]),
+                _attr("cab.scoring_mode", r.get("scoring_mode", "")),
+                _attr("cab.dimension", r.get("dimension", "")),
+                _attr("cab.retries", timing.get("retries", 0)),
+            ] + [
+                _attr(f"cab.tokens.{role}.{direction}", usage[direction])
+                for role, usage in timing.get("tokens", {}).items()
+                for direction in ("input", "output")
+            ],
+        })
+
+        for span in timing["spans"]:
+            begin = start_ns + int(span["offset"] * 1e9)
+            extra = {k: v for k, v in span.items() if k not in ("name", "offset", "duration")}
+            spans.append({
+                "traceId": trace_id,
+                "spanId": os.urandom(8).hex(),
+                "parentSpanId": root_id,
+                "name": span["name"],
+                "kind": 3 if span["name"] in ("model", "judge") else 1,
+                "startTimeUnixNano": str(begin),
+                "endTimeUnixNano": str(begin + int(span["duration"] * 1e9)),
+                "attributes": [_attr(f"cab.{k}", v) for k, v in extra.items()],
+            })
+
+    model = output.get("metadata", {}).get("model") or "unknown"
+    payload = {
+        "resourceSpans": [{
+            "resource": {"attributes": [
+                _attr("service.name", "cab_benchmark"),
+                _attr("cab.model", model),
+            ]},
+            "scopeSpans": [{"scope": {"name": "cab_benchmark"}, "spans": spans}],
+        }]
+    }
+
+    with open(path, "w") as f:
+        json.dump(payload, f)
@@ -0,0 +1,341 @@
+"""Indexed SQLite store for results from many evaluation runs."""
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from .results_io import is_jsonl, iter_results, load_results, load_summary
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    model TEXT NOT NULL,
+    source TEXT UNIQUE,
+    timestamp TEXT,
+    dataset_version TEXT,
+    total_questions INTEGER,
+    cab_score REAL,
+    overall_score REAL,
+    summary TEXT,
+    ingested_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    model TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    dimension TEXT,
+    tradition TEXT,
+    difficulty TEXT,
+    scoring_mode TEXT,
+    score REAL,
+    details TEXT,
+    PRIMARY KEY (run_id, question_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_runs_model ON runs(model, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_model ON results(model, question_id);
+CREATE INDEX IF NOT EXISTS idx_results_question ON results(question_id);
+CREATE INDEX IF NOT EXISTS idx_results_dimension ON results(dimension, tradition);
+CREATE INDEX IF NOT EXISTS idx_results_tradition ON results(tradition, dimension);
+"""
+
+# Columns that may be used for filtering and grouping in queries
+QUERY_COLUMNS = {
+    "model": "r.model",
+    "run": "r.run_id",
+    "question": "r.question_id",
+    "dimension": "r.dimension",
+    "tradition": "r.tradition",
+    "difficulty": "r.difficulty",
+    "mode": "r.scoring_mode",
+}
+
+
+class ResultsWarehouse:
+    """
+    Local results warehouse backed by an embedded SQLite database.
+
+    Example usage:
+        with ResultsWarehouse("results/cab.db") as wh:
+            wh.ingest("results/claude_sonnet_full.json", model="claude-3-sonnet")
+            rows = wh.query(dimension=["Pastoral Care"], tradition=["Catholic"])
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def ingest(
+        self,
+        results_path: Union[str, Path],
+        model: Optional[str] = None,
+        keep_details: bool = True,
+    ) -> int:
+        """
+        Ingest one results file, replacing any earlier ingest of the same file.
+
+        JSONL results are streamed into the database without loading the
+        whole file.
+
+        Args:
+            results_path: Path to an evaluation results file
+            model: Model name (defaults to metadata 'model' or the file stem)
+            keep_details: Store each result's details as JSON
+
+        Returns:
+            The run_id assigned to the ingested run
+        """
+        results_path = Path(results_path)
+        if is_jsonl(results_path):
+            head = load_summary(results_path)
+            results = iter_results(results_path)
+        else:
+            head = load_results(results_path)
+            results = head.get("detailed_results", [])
+
+        return self._ingest(
+            head.get("metadata", {}),
+            head.get("summary", {}),
+            results,
+            model=model or head.get("metadata", {}).get("model") or results_path.stem,
+            source=str(results_path.resolve()),
+            keep_details=keep_details,
+        )
+
+    def ingest_run(
+        self,
+        data: Dict,
+        model: str,
+        source: Optional[str] = None,
+        keep_details: bool = True,
+    ) -> int:
+        """Ingest an in-memory evaluation output (as returned by ``evaluate``)."""
+        return self._ingest(
+            data.get("metadata", {}),
+            data.get("summary", {}),
+            data.get("detailed_results", []),
+            model=model,
+            source=source,
+            keep_details=keep_details,
+        )
+
+    def _ingest(
+        self,
+        metadata: Dict,
+        summary: Dict,
+        results: Iterable[Dict],
+        model: str,
+        source: Optional[str],
+        keep_details: bool,
+    ) -> int:
+        """Insert a run row and its results in one transaction."""
+        with self.conn:
+            if source is not None:
+                self.conn.execute("DELETE FROM runs WHERE source = ?", (source,))
+
+            cursor = self.conn.execute(
+                """
+                INSERT INTO runs (model, source, timestamp, dataset_version,
+                                  total_questions, cab_score, overall_score,
+                                  summary, ingested_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    model,
+                    source,
+                    metadata.get("timestamp"),
+                    metadata.get("dataset_version"),
+                    summary.get("total_questions"),
+                    summary.get("cab_score"),
+                    summary.get("overall_score"),
+                    json.dumps(summary),
+                    datetime.now().isoformat(),
+                ),
+            )
+            run_id = cursor.lastrowid
+
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO results (run_id, model, question_id, dimension,
+                                                tradition, difficulty, scoring_mode,
+                                                score, details)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    (
+                        run_id,
+                        model,
+                        r["id"],
+                        r.get("dimension"),
+                        r.get("tradition"),
+                        r.get("difficulty"),
+                        r.get("scoring_mode"),
+                        r.get("score"),
+                        json.dumps(r.get("details")) if keep_details else None,
+                    )
+                    for r in results
+                ),
+            )
+
+        return run_id
+
+    def _where(
+        self,
+        filters: Dict[str, Optional[Iterable]],
+        since: Optional[str],
+        until: Optional[str],
+    ):
+        """Build a WHERE clause and parameters from query filters."""
+        clauses = []
+        params: List = []
+
+        for key, values in filters.items():
+            if not values:
+                continue
+            values = list(values)
+            placeholders = ", ".join("?" for _ in values)
+            clauses.append(f"{QUERY_COLUMNS[key]} IN ({placeholders})")
+            params.extend(values)
+
+        if since:
+            clauses.append("runs.timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("runs.timestamp < ?")
+            params.append(until)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query(
+        self,
+        model: Optional[List[str]] = None,
+        run: Optional[List[int]] = None,
+        question: Optional[List[str]] = None,
+        dimension: Optional[List[str]] = None,
+        tradition: Optional[List[str]] = None,
+        difficulty: Optional[List[str]] = None,
+        mode: Optional[List[str]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        include_details: bool = False,
+    ) -> List[Dict]:
+        """
+        Fetch per-question results matching the filters.
+
+        Args:
+            model, run, question, dimension, tradition, difficulty, mode:
+                Restrict to any of the given values
+            since: ISO timestamp; only runs at or after this time
+            until: ISO timestamp; only runs before this time
+            include_details: Also return the stored details JSON
+
+        Returns:
+            List of result dicts
+        """
+        where, params = self._where(
+            {
+                "model": model,
+                "run": run,
+                "question": question,
+                "dimension": dimension,
+                "tradition": tradition,
+                "difficulty": difficulty,
+                "mode": mode,
+            },
+            since,
+            until,
+        )
+        details = ", r.details" if include_details else ""
+        sql = f"""
+            SELECT r.run_id, r.model, runs.timestamp, r.question_id, r.dimension,
+                   r.tradition, r.difficulty, r.scoring_mode, r.score{details}
+            FROM results r JOIN runs ON runs.run_id = r.run_id
+            {where}
+            ORDER BY r.model, r.run_id, r.question_id
+        """
+
+        rows = []
+        for row in self.conn.execute(sql, params):
+            item = dict(row)
+            if include_details and item.get("details"):
+                item["details"] = json.loads(item["details"])
+            rows.append(item)
+        return rows
+
+    def summarize(
+        self,
+        group_by: List[str],
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        **filters,
+    ) -> List[Dict]:
+        """
+        Aggregate mean score and count per group, computed inside SQLite.
+
+        Args:
+            group_by: Columns to group on (any of QUERY_COLUMNS)
+            since: ISO timestamp; only runs at or after this time
+            until: ISO timestamp; only runs before this time
+            **filters: Same filters as ``query``
+
+        Returns:
+            List of dicts with the group columns, 'mean_score' and 'count'
+        """
+        for key in group_by:
+            if key not in QUERY_COLUMNS:
+                raise ValueError(f"Unknown group column: {key}")
+
+        where, params = self._where(filters, since, until)
+        columns = ", ".join(f"{QUERY_COLUMNS[k]} AS {k}" for k in group_by)
+        groups = ", ".join(QUERY_COLUMNS[k] for k in group_by)
+        select = f"{columns}, " if group_by else ""
+        group = f"GROUP BY {groups} ORDER BY {groups}" if group_by else ""
+
+        sql = f"""
+            SELECT {select}AVG(r.score) AS mean_score, COUNT(*) AS count
+            FROM results r JOIN runs ON runs.run_id = r.run_id
+            {where}
+            {group}
+        """
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def runs(self, model: Optional[List[str]] = None) -> List[Dict]:
+        """List ingested runs with their headline scores."""
+        sql = """
+            SELECT run_id, model, timestamp, dataset_version, total_questions,
+                   cab_score, overall_score, source
+            FROM runs
+        """
+        params: List = []
+        if model:
+            sql += f" WHERE model IN ({', '.join('?' for _ in model)})"
+            params.extend(model)
+        sql += " ORDER BY timestamp"
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def run_summary(self, run_id: int) -> Dict:
+        """Stored aggregate summary for one run."""
+        row = self.conn.execute(
+            "SELECT summary FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Run not found: {run_id}")
+        return json.loads(row["summary"])
@@ -0,0 +1,45 @@
+"""Tests for the synthetic data generator and benchmark runner."""
+import json
+import pytest
+from benchmarks.run import find_regressions, run_benchmarks
+from benchmarks.synthetic import generate_dataset, generate_results
+from cab_benchmark.loader import load_dataset
+
+def test_synthetic_dataset_is_schema_valid(tmp_path):
+    data = generate_dataset(12000, seed=1)
+    path = tmp_path / "synthetic.json"
+    path.write_text(json.dumps(data))
+    loaded = load_dataset(path)
+    assert len(loaded["questions"]) == 12000
+    assert loaded["questions"][-1]["id"] == "CAB-12000"
+    modes = [q["scoring_mode"] for q in loaded["questions"]]
+    assert set(modes) == {"objective", "subjective"}
+    # Default mix follows the real dataset (7.6% objective)
+    assert modes.count("objective") / len(modes) == pytest.approx(0.076, abs=0.01)
+
+def test_invalid_question_is_still_reported(tmp_path):
+    data = generate_dataset(3)
+    data["questions"][1]["difficulty"] = "L9"
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps(data))
+    with pytest.raises(ValueError, match="Q1: 'L9' is not one of"):
+        load_dataset(path)
+
+def test_synthetic_results_match_questions():
+    questions = generate_dataset(200)["questions"]
+    output = generate_results(questions, seed=2)
+    assert [r["id"] for r in output["detailed_results"]] == [q["id"] for q in questions]
+    assert output["summary"]["total_questions"] == 200
+
+def test_run_and_compare_against_baseline():
+    report = run_benchmarks([200], ["get_statistics", "aggregate_scores"], repeat=1, verbose=False)
+    assert [(r["name"], r["size"]) for r in report["results"]] == [
+        ("get_statistics", 200), ("aggregate_scores", 200),
+    ]
+    assert all(r["seconds_min"] > 0 and r["peak_memory_bytes"] >= 0 for r in report["results"])
+    assert find_regressions(report, report) == []
+
+    slower = json.loads(json.dumps(report))
+    slower["results"][0]["seconds_min"] *= 3
+    regressions = find_regressions(slower, report, max_slowdown=1.5)
+    assert [(r["name"], r["metric"]) for r in regressions] == [("get_statistics", "seconds_min")]
@@ -0,0 +1,49 @@
+"""Tests for hedged requests."""
+import threading
+import time
+from cab_benchmark.hedging import Hedger
+
+def test_no_hedging_before_min_samples():
+    hedger = Hedger(percentile=0.5, budget=1.0, min_samples=5)
+    for _ in range(4):
+        assert hedger.call("model", str.upper, "a") == "A"
+    assert hedger.threshold("model") is None
+    assert hedger.report()["hedge_rate"] == 0.0
+    hedger.close()
+
+def test_slow_call_is_hedged():
+    hedger = Hedger(percentile=0.5, budget=1.0, min_samples=5)
+    for _ in range(5):
+        hedger.call("judge", lambda p: p, "fast")
+    first = threading.Event()
+    def sometimes_slow(prompt):
+        # Only the first (primary) request stalls; the duplicate is fast
+        if not first.is_set():
+            first.set()
+            time.sleep(0.5)
+            return "slow"
+        return "fast"
+    start = time.perf_counter()
+    assert hedger.call("judge", sometimes_slow, "x") == "fast"
+    assert time.perf_counter() - start < 0.4
+    report = hedger.report()
+    assert report["hedges"] == {"judge": 1}
+    assert report["hedge_wins"] == {"judge": 1}
+    assert report["latency_saved"] > 0
+    hedger.close()
+
+def test_budget_caps_hedges():
+    hedger = Hedger(percentile=0.0, budget=0.0, min_samples=1)
+    hedger.call("model", lambda p: p, "x")
+    assert hedger.call("model", lambda p: time.sleep(0.01) or p, "y") == "y"
+    assert hedger.report()["hedges"] == {}
+    hedger.close()
+
+def test_evaluator_sizes_hedger_for_administrations():
+    from cab_benchmark.evaluator import CABEvaluator
+    evaluator = CABEvaluator(model_fn=str, verbose=False, max_workers=2,
+                             administrations=8, hedge_percentile=0.95)
+    evaluator._start_hedging()
+    # Every concurrent model call can hold a primary and a duplicate
+    assert evaluator._hedger._pool._max_workers >= 2 * 2 * 8
+    evaluator._stop_hedging()
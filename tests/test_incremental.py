@@ -0,0 +1,67 @@
+"""Tests for incremental re-evaluation by content hash."""
+import json
+import pytest
+from cab_benchmark.evaluator import CABEvaluator
+from cab_benchmark.incremental import content_hash, load_reusable
+
+def _dataset(path, questions):
+    path.write_text(json.dumps({"version": "test", "questions": questions}))
+    return str(path)
+
+def _question(i, text):
+    return {
+        "id": f"CAB-{i:04d}", "scoring_mode": "objective", "dimension": "Biblical Literacy",
+        "tradition": "Catholic", "difficulty": "L1", "question": text,
+        "options": ["A) one", "B) two", "C) three", "D) four"], "correct_answer": "B",
+    }
+
+def test_content_hash_ignores_labels_but_not_content():
+    q = _question(1, "Which?")
+    assert content_hash(q) == content_hash(dict(q, id="X", dimension="Apologetics", difficulty="L3"))
+    assert content_hash(q) != content_hash(dict(q, correct_answer="C"))
+    assert content_hash(q) != content_hash(dict(q, tradition="Baptist"))
+
+def test_only_changed_questions_are_rerun(tmp_path):
+    calls = []
+    def model(prompt):
+        calls.append(prompt)
+        return "B"
+    evaluator = CABEvaluator(model_fn=model, verbose=False, randomize_options=False, model_name="m")
+    v1 = [_question(i, f"Question {i}?") for i in range(5)]
+    prior = str(tmp_path / "v1.jsonl")
+    evaluator.evaluate(_dataset(tmp_path / "v1.json", v1), output_path=prior)
+    assert len(calls) == 5
+
+    calls.clear()
+    v2 = v1[:4] + [_question(4, "Revised question?"), _question(5, "New question?")]
+    output = evaluator.evaluate(_dataset(tmp_path / "v2.json", v2), prior_results=prior)
+    assert len(calls) == 2
+    incremental = output["metadata"]["incremental"]
+    assert incremental["carried_over"] == ["CAB-0000", "CAB-0001", "CAB-0002", "CAB-0003"]
+    assert incremental["recomputed"] == ["CAB-0004", "CAB-0005"]
+    assert [r["id"] for r in output["detailed_results"]] == [q["id"] for q in v2]
+    assert output["summary"]["performance"]["questions"] == 2
+
+def test_prior_run_of_another_model_is_rejected():
+    prior = {"metadata": {"model": "other"}, "detailed_results": []}
+    with pytest.raises(ValueError, match="model"):
+        load_reusable(prior, model="m")
+
+def test_prior_scoring_setup_must_match():
+    judge = {"model": "claude-3-opus-20240229", "num_judges": 3}
+    meta = {"model": "m", "judge_mode": "panel", "judge": judge, "randomize_options": True}
+    prior = {"metadata": meta, "detailed_results": [{"id": "x", "content_hash": "h"}]}
+    assert load_reusable(prior, model="m", judge=judge) == {"h": prior["detailed_results"][0]}
+    with pytest.raises(ValueError, match="judged with"):
+        load_reusable(prior, model="m", judge={"model": "gpt-4o", "num_judges": 5})
+    with pytest.raises(ValueError, match="judged with"):
+        load_reusable(prior, model="m", judge=None)
+    with pytest.raises(ValueError, match="randomize_options"):
+        load_reusable(prior, model="m", judge=judge, randomize_options=False)
+    # A judge-free (objective-only) prior run can be extended with a judge
+    objective_only = {"metadata": dict(meta, judge=None), "detailed_results": []}
+    assert load_reusable(objective_only, model="m", judge=judge) == {}
+    # Runs that predate recording the setup are recomputed in full
+    older = {"metadata": {"model": "m", "randomize_options": True}, "detailed_results": prior["detailed_results"]}
+    with pytest.warns(UserWarning, match="recomputing every question"):
+        assert load_reusable(older, model="m", judge=judge) == {}
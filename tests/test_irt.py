@@ -0,0 +1,102 @@
+"""Tests for IRT calibration and adaptive testing."""
+import numpy as np
+import pytest
+from cab_benchmark.irt import AdaptiveTester, ItemBank, calibrate, estimate_ability
+
+def _questions(n, dimensions=("Doctrine",)):
+    levels = ["L1", "L2", "L3"]
+    return [
+        {"id": f"Q{i}", "dimension": dimensions[i % len(dimensions)], "difficulty": levels[i % 3]}
+        for i in range(n)
+    ]
+
+def _simulate(questions, a, b, theta, rng):
+    prob = 1 / (1 + np.exp(-a * (theta - b)))
+    return {"detailed_results": [
+        dict(q, score=float(rng.random() < p)) for q, p in zip(questions, prob)
+    ]}
+
+def test_calibration_recovers_difficulty():
+    rng = np.random.default_rng(0)
+    questions = _questions(60)
+    a = np.full(60, 1.5)
+    b = np.array([{"L1": -1, "L2": 0, "L3": 1}[q["difficulty"]] for q in questions]) + rng.normal(0, 0.5, 60)
+    runs = [_simulate(questions, a, b, theta, rng) for theta in rng.normal(0, 1, 50)]
+    bank = calibrate(runs, questions + [{"id": "NEW", "dimension": "Doctrine", "difficulty": "L3"}])
+    fitted = np.array([bank.items[q["id"]]["b"] for q in questions])
+    assert np.corrcoef(fitted, b)[0, 1] > 0.85
+    # Unseen items keep their level prior
+    assert bank.params({"id": "NEW"}) == (1.0, 1.0)
+    assert bank.items["NEW"]["n"] == 0
+
+def test_item_bank_round_trip(tmp_path):
+    bank = calibrate([], _questions(3))
+    path = tmp_path / "bank.json"
+    bank.save(path)
+    loaded = ItemBank.load(path)
+    assert loaded.items == bank.items
+    assert loaded.params({"id": "Q2"}) == (1.0, 1.0)
+
+def test_estimate_ability_moves_with_responses():
+    theta, se = estimate_ability([])
+    assert theta == pytest.approx(0.0, abs=1e-9)
+    assert se == pytest.approx(1.0, abs=0.01)
+    high, high_se = estimate_ability([(1.5, 0.0, 1.0)] * 5)
+    assert high > 0.5 and high_se < se
+
+def test_adaptive_stops_early_with_accurate_estimate():
+    rng = np.random.default_rng(1)
+    questions = _questions(600, dimensions=("Doctrine", "Ethics"))
+    items = {q["id"]: {"a": 2.0, "b": float(rng.uniform(-3, 3))} for q in questions}
+    bank = ItemBank(items)
+    tester = AdaptiveTester(questions, bank, se_target=0.3)
+    true_theta = {"Doctrine": 1.0, "Ethics": -0.5}
+    while True:
+        batch = tester.next_batch()
+        if not batch:
+            break
+        assert len({questions[i]["dimension"] for i in batch}) == len(batch)
+        for i in batch:
+            q = questions[i]
+            p = 1 / (1 + np.exp(-2.0 * (true_theta[q["dimension"]] - items[q["id"]]["b"])))
+            tester.observe(i, float(rng.random() < p))
+    report = tester.report()
+    assert report["call_reduction"] >= 5
+    for dim, info in report["by_dimension"].items():
+        assert info["converged"]
+        assert abs(info["theta"] - true_theta[dim]) < 3 * info["se"]
+
+def test_adaptive_evaluate_reports_predicted_pool_scores(tmp_path):
+    import json
+    from cab_benchmark.evaluator import CABEvaluator
+    from cab_benchmark.warehouse import ResultsWarehouse
+
+    questions = [
+        {"id": f"CAB-{i:04d}", "dimension": ["Apologetics", "Church History"][i % 2],
+         "tradition": "Baptist", "difficulty": ["L1", "L2", "L3"][i % 3],
+         "scoring_mode": "objective", "question": f"Question {i}?",
+         "options": ["A) one", "B) two", "C) three", "D) four"], "correct_answer": "A"}
+        for i in range(60)
+    ]
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"version": "test", "questions": questions}))
+    bank = ItemBank({q["id"]: {"a": 1.5, "b": (i % 7) - 3.0} for i, q in enumerate(questions)})
+    evaluator = CABEvaluator(model_fn=lambda p: "A", verbose=False, seed=0, randomize_options=False)
+    output = evaluator.evaluate(str(path), item_bank=bank, se_target=0.6)
+
+    summary = output["summary"]
+    adaptive = summary["adaptive"]
+    assert adaptive["items"] < adaptive["pool"]
+    for dim, info in summary["by_dimension"].items():
+        assert info["score"] == adaptive["by_dimension"][dim]["predicted_score"]
+        assert info["pool"] == 30
+    assert summary["overall_score"] == adaptive["predicted_score"]
+    # Every administered answer is correct, but the pool prediction is lower
+    assert summary["administered"]["cab_score"] == 1.0
+    assert summary["cab_score"] < 1.0
+    assert "by_tradition" not in summary
+
+    with ResultsWarehouse(tmp_path / "cab.db") as wh:
+        wh.ingest_run(output, model="m")
+        row = wh.conn.execute("SELECT cab_score FROM runs").fetchone()
+    assert row[0] == pytest.approx(summary["cab_score"])
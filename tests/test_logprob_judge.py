@@ -0,0 +1,86 @@
+"""Tests for single-call logprob judge scoring."""
+import json
+import math
+import pytest
+from cab_benchmark.evaluator import CABEvaluator
+from cab_benchmark.reliability import judge_mode_agreement
+from cab_benchmark.scorer import AnthropicSubjectiveScorer, SubjectiveScorer
+
+QUESTION = {"id": "CAB-0001", "scenario": "S", "rubric_focus": "R", "tradition": "Catholic"}
+
+class FakeJudge(SubjectiveScorer):
+    """Panel replies 'SCORE: 4'; logprob calls return a fixed distribution."""
+    def __init__(self, probs, **kwargs):
+        super().__init__(judge_client=None, **kwargs)
+        self.probs = probs
+        self.calls = 0
+
+    def _judge(self, prompt):
+        self.calls += 1
+        return "SCORE: 4\nJUSTIFICATION: Fine.", {"input_tokens": 100, "output_tokens": 40}
+
+    def _judge_distribution(self, prompt):
+        self.calls += 1
+        assert prompt.rstrip().endswith("SCORE:")
+        return {t: math.log(p) for t, p in self.probs.items()}, {"input_tokens": 100, "output_tokens": 1}
+
+def test_expected_and_median_from_distribution():
+    judge = FakeJudge({"4": 0.5, " 5": 0.2, "3": 0.2, "I": 0.1}, judge_mode="logprob")
+    score, details = judge.score(QUESTION, "response")
+    assert judge.calls == 1
+    assert details["distribution_mass"] == pytest.approx(0.9)
+    assert details["score_distribution"]["5"] == pytest.approx(0.2 / 0.9)
+    assert details["expected_score"] == pytest.approx((3 * 0.2 + 4 * 0.5 + 5 * 0.2) / 0.9)
+    assert details["median_score"] == 4
+    assert score == pytest.approx((details["expected_score"] - 1) / 4)
+
+def test_no_score_tokens_is_undecided():
+    judge = FakeJudge({"The": 0.9}, judge_mode="logprob")
+    _, details = judge.score(QUESTION, "response")
+    assert details["expected_score"] == 3.0
+    assert details["distribution_mass"] == 0.0
+
+def test_logprob_mode_requires_logprob_support():
+    with pytest.raises(ValueError, match="logprob"):
+        AnthropicSubjectiveScorer(judge_client=None, judge_mode="logprob")
+    with pytest.raises(ValueError, match="judge_mode"):
+        SubjectiveScorer(judge_client=None, judge_mode="votes")
+
+def test_rejudge_stored_panel_run(tmp_path):
+    dataset = tmp_path / "data.json"
+    questions = [
+        {"id": f"CAB-{i:04d}", "scoring_mode": "subjective", "dimension": "Pastoral Care",
+         "tradition": "Catholic", "difficulty": "L2", "scenario": f"Scenario {i}", "rubric_focus": "Care"}
+        for i in range(4)
+    ]
+    dataset.write_text(json.dumps({"version": "test", "questions": questions}))
+
+    evaluator = CABEvaluator(model_fn=lambda p: "answer", verbose=False)
+    evaluator.subjective_scorer = FakeJudge({"4": 0.8, "5": 0.2})
+    panel = evaluator.evaluate(str(dataset))
+    assert evaluator.subjective_scorer.calls == 12
+
+    evaluator.subjective_scorer = FakeJudge({"4": 0.8, "5": 0.2}, judge_mode="logprob")
+    evaluator.judge_mode = "logprob"
+    rejudged = evaluator.rejudge(panel, str(dataset))
+    assert evaluator.subjective_scorer.calls == 4
+    agreement = rejudged["summary"]["agreement"]
+    assert agreement["items"] == 4
+    assert agreement["exact_agreement"] == 1.0
+    assert agreement["mean_difference"] == pytest.approx(0.2)
+    assert agreement["judge_calls"] == {"reference": 12, "candidate": 4}
+    assert agreement["judge_output_tokens"] == {"reference": 480, "candidate": 4}
+
+def test_agreement_pairs_by_id():
+    ref = [{"id": "a", "scoring_mode": "subjective", "details": {"median_score": 2, "raw_scores": [2, 2, 3]}}]
+    cand = [
+        {"id": "a", "details": {"median_score": 3, "expected_score": 2.6}},
+        {"id": "b", "details": {"median_score": 5, "expected_score": 5.0}},
+    ]
+    report = judge_mode_agreement(ref, cand)
+    assert report["items"] == 1
+    assert report["exact_agreement"] == 0.0
+    assert report["within_one"] == 1.0
+    assert report["mean_abs_error"] == pytest.approx(0.6)
+    assert report["correlation"] is None
+    assert judge_mode_agreement(ref, []) == {"items": 0}
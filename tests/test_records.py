@@ -0,0 +1,32 @@
+"""Tests for compact result records."""
+import json
+from cab_benchmark.aggregator import aggregate_scores
+from cab_benchmark.records import CompactResult, SpillStore, json_default
+
+def _result(i):
+    return {"id": f"CAB-{i:04d}", "dimension": "Pastoral Care", "tradition": "Catholic",
+            "difficulty": "L2", "scoring_mode": "subjective", "score": 0.75,
+            "details": {"raw_scores": [4, 4, 5], "raw_response": "long text " * 100}}
+
+def test_round_trip(tmp_path):
+    store = SpillStore(tmp_path / "details.jsonl")
+    results = [_result(i) for i in range(3)]
+    compact = [CompactResult(r, store) for r in results]
+    assert compact[1] == results[1]
+    assert compact[1].to_dict() == results[1]
+    assert compact[2]["details"]["raw_scores"] == [4, 4, 5]
+    assert "dimension" in compact[0] and compact[0].get("missing") is None
+
+def test_works_with_aggregation_and_json():
+    store = SpillStore()
+    results = [_result(i) for i in range(4)]
+    compact = [CompactResult(r, store) for r in results]
+    assert aggregate_scores(compact) == aggregate_scores(results)
+    assert json.loads(json.dumps(compact, default=json_default)) == results
+
+def test_unknown_categories_are_interned(tmp_path):
+    r = dict(_result(0), dimension="Liturgical Music")
+    del r["details"]
+    record = CompactResult(r, SpillStore(tmp_path / "d.jsonl"))
+    assert record["dimension"] == "Liturgical Music"
+    assert "details" not in record
@@ -0,0 +1,39 @@
+"""Tests for inter-judge reliability tracking."""
+import random
+import pytest
+from cab_benchmark.reliability import CoincidenceMatrix, ReliabilityTracker
+
+def test_perfect_agreement():
+    m = CoincidenceMatrix()
+    for v in [1, 3, 5, 2]:
+        m.add([v, v, v])
+    assert m.alpha("ordinal") == pytest.approx(1.0)
+    assert m.alpha("interval") == pytest.approx(1.0)
+
+def test_alpha_matches_krippendorff():
+    krippendorff = pytest.importorskip("krippendorff")
+    np = pytest.importorskip("numpy")
+    rng = random.Random(0)
+    units = [[rng.choice([2, 3, 4, 4, 5]) for _ in range(3)] for _ in range(100)]
+    m = CoincidenceMatrix()
+    for u in units:
+        m.add(u)
+    data = np.array(units, dtype=float).T
+    for metric in ["ordinal", "interval", "nominal"]:
+        expected = krippendorff.alpha(
+            reliability_data=data, level_of_measurement=metric, value_domain=[1, 2, 3, 4, 5]
+        )
+        assert m.alpha(metric) == pytest.approx(expected)
+
+def test_tracker_flags_low_agreement():
+    tracker = ReliabilityTracker(max_spread=2)
+    agree = {"id": "CAB-0001", "dimension": "Pastoral Care", "tradition": "Catholic",
+             "details": {"raw_scores": [4, 4, 5]}}
+    split = {"id": "CAB-0002", "dimension": "Pastoral Care", "tradition": "Catholic",
+             "details": {"raw_scores": [1, 3, 5]}}
+    assert tracker.update(agree) is False
+    assert tracker.update(split) is True
+    report = tracker.report()
+    assert report["units"] == 2
+    assert report["by_dimension"]["Pastoral Care"]["units"] == 2
+    assert report["low_agreement"]["items"][0]["id"] == "CAB-0002"
@@ -0,0 +1,53 @@
+"""Tests for results file formats."""
+import json
+from cab_benchmark.results_io import (
+    ResultsWriter, load_results, load_summary, save_results, sidecar_path,
+)
+
+def _output():
+    results = [{"id": f"CAB-{i:04d}", "score": i / 10, "details": {"raw_response": "x" * i}}
+               for i in range(5)]
+    return {"metadata": {"model": "m"}, "summary": {"overall_score": 0.2}, "detailed_results": results}
+
+def test_sidecar_path(tmp_path):
+    assert sidecar_path(tmp_path / "run.jsonl.gz").name == "run.summary.json"
+    assert sidecar_path(tmp_path / "run.jsonl").name == "run.summary.json"
+
+def test_jsonl_round_trip(tmp_path):
+    output = _output()
+    for name in ("run.json", "run.jsonl", "run.jsonl.gz"):
+        save_results(output, tmp_path / name)
+        assert load_results(tmp_path / name) == output
+
+def test_completion_order_restored(tmp_path):
+    output = _output()
+    path = tmp_path / "run.jsonl.gz"
+    with ResultsWriter(path, output["metadata"]) as writer:
+        for r in reversed(output["detailed_results"]):
+            writer.write(r)
+        writer.finish(output["summary"], order=[r["id"] for r in output["detailed_results"]])
+    assert load_results(path)["detailed_results"] == output["detailed_results"]
+
+def test_summary_without_sidecar(tmp_path):
+    path = tmp_path / "run.jsonl"
+    save_results(_output(), path)
+    assert json.loads(sidecar_path(path).read_text())["summary"] == {"overall_score": 0.2}
+    sidecar_path(path).unlink()
+    head = load_summary(path)
+    assert head == {"metadata": {"model": "m"}, "summary": {"overall_score": 0.2}}
+
+def test_stale_sidecar_is_not_trusted(tmp_path):
+    path = tmp_path / "run.jsonl.gz"
+    save_results(_output(), path)
+    stale = sidecar_path(path).read_text()
+
+    # A rerun that fails before finishing must not report the old run
+    writer = ResultsWriter(path, {"model": "new"})
+    writer.write(_output()["detailed_results"][0])
+    writer.close()
+    assert not sidecar_path(path).exists()
+    assert load_summary(path) == {"metadata": {"model": "new"}, "summary": {}}
+
+    # A sidecar copied in from another run is ignored as well
+    sidecar_path(path).write_text(stale)
+    assert load_summary(path)["metadata"] == {"model": "new"}
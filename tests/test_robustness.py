@@ -0,0 +1,94 @@
+"""Tests for multi-administration scoring and position-bias statistics."""
+import pytest
+from cab_benchmark.robustness import PositionBiasTracker, chi_square_sf
+from cab_benchmark.scorer import ObjectiveScorer
+
+QUESTION = {
+    "id": "Q1",
+    "question": "Which?",
+    "options": ["A) one", "B) two", "C) three", "D) four"],
+    "correct_answer": "B",
+}
+
+def test_chi_square_sf_critical_values():
+    assert chi_square_sf(7.815, 3) == pytest.approx(0.05, abs=1e-3)
+    assert chi_square_sf(3.841, 1) == pytest.approx(0.05, abs=1e-3)
+    assert chi_square_sf(5.991, 2) == pytest.approx(0.05, abs=1e-3)
+    assert chi_square_sf(0.0, 3) == 1.0
+
+def test_administrations_use_distinct_relabeled_orders():
+    scorer = ObjectiveScorer(seed=1)
+    prepared = scorer.prepare_administrations(QUESTION, 4)
+    orders = [meta["order"] for _, meta in prepared]
+    assert len(set(orders)) == 4
+    for prompt, meta in prepared:
+        # Letters shown match positions, so the scored letter is the one displayed
+        assert meta["options"][0].startswith("A) ")
+        assert f"{meta['shuffled_correct']}) two" in prompt
+    assert scorer.prepare_administrations(QUESTION, 4) == prepared
+
+def test_administrations_capped_at_distinct_orders():
+    scorer = ObjectiveScorer(seed=1)
+    assert len({m["order"] for _, m in scorer.prepare_administrations(QUESTION, 50)}) == 24
+    # Many options would have too many orders to enumerate
+    many = dict(QUESTION, options=[f"{chr(65 + i)}) o{i}" for i in range(14)])
+    assert len({m["order"] for _, m in scorer.prepare_administrations(many, 5)}) == 5
+
+def test_consistent_model_scores_fully_consistent():
+    scorer = ObjectiveScorer(seed=3)
+    prepared = scorer.prepare_administrations(QUESTION, 3)
+    responses = [meta["shuffled_correct"] for _, meta in prepared]
+    score, details = scorer.score_administrations(QUESTION, responses, [m for _, m in prepared])
+    assert score == 1.0
+    assert details["consistency"] == 1.0
+    assert {a["chosen_option"] for a in details["administrations"]} == {"B"}
+
+def test_position_biased_model_is_flagged():
+    scorer = ObjectiveScorer(seed=0)
+    tracker = PositionBiasTracker()
+    for i in range(30):
+        question = dict(QUESTION, id=f"Q{i}")
+        prepared = scorer.prepare_administrations(question, 4)
+        score, details = scorer.score_administrations(
+            question, ["A"] * len(prepared), [m for _, m in prepared]
+        )
+        tracker.update({"details": details})
+    report = tracker.report()
+    assert report["questions"] == 30
+    assert report["administrations"] == 120
+    assert report["position_bias"]["choice_rate"]["A"] == 1.0
+    assert report["position_bias"]["p_value"] < 1e-6
+
+def test_strict_extraction():
+    extract = ObjectiveScorer.extract_answer_strict
+    assert extract("The answer is C") == "C"
+    assert extract("C) three") == "C"
+    assert extract("(B)") == "B"
+    assert extract("Answer: D") == "D"
+    assert extract("**Answer:** C") == "C"
+    assert extract("Option B is correct") == "B"
+    assert extract("A good question. I think B) fits") == "B"
+    assert extract("A) one or B) two") is None
+    assert extract("I am not sure") is None
+
+def test_prose_answers_are_not_read_as_position_a():
+    scorer = ObjectiveScorer(seed=5)
+    prepared = scorer.prepare_administrations(QUESTION, 4)
+    responses = [f"The answer is {meta['shuffled_correct']}" for _, meta in prepared]
+    score, details = scorer.score_administrations(QUESTION, responses, [m for _, m in prepared])
+    assert score == 1.0
+    assert details["consistency"] == 1.0
+    assert {a["chosen_option"] for a in details["administrations"]} == {"B"}
+
+    score, details = scorer.score_administrations(
+        QUESTION, ["Hard to say"] * len(prepared), [m for _, m in prepared]
+    )
+    assert score == 0.0
+    assert details["consistency"] == 0.0
+    assert details["unanswered"] == 4
+    tracker = PositionBiasTracker()
+    tracker.update({"details": details})
+    report = tracker.report()
+    assert report["position_bias"]["unanswered"] == 4
+    assert report["fully_consistent"] == 0
+    assert report["position_bias"]["p_value"] is None
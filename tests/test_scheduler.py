@@ -0,0 +1,48 @@
+"""Tests for latency-aware scheduling."""
+import pytest
+from cab_benchmark.evaluator import CABEvaluator
+from cab_benchmark.scheduler import LatencyScheduler
+
+def _questions():
+    return [
+        {"id": "CAB-0001", "scoring_mode": "objective", "dimension": "Apologetics",
+         "tradition": "Baptist", "difficulty": "L1", "question": "Q?",
+         "options": ["A) x", "B) y", "C) z", "D) w"], "correct_answer": "A"},
+        {"id": "CAB-0002", "scoring_mode": "subjective", "dimension": "Pastoral Care",
+         "tradition": "Baptist", "difficulty": "L2", "scenario": "s" * 50, "rubric_focus": "r"},
+        {"id": "CAB-0003", "scoring_mode": "subjective", "dimension": "Pastoral Care",
+         "tradition": "Baptist", "difficulty": "L2", "scenario": "s" * 500, "rubric_focus": "r"},
+    ]
+
+def _drain(scheduler):
+    return [scheduler.pop() for _ in range(len(scheduler))]
+
+def test_longest_first():
+    assert _drain(LatencyScheduler(_questions(), num_judges=3)) == [2, 1, 0]
+
+def test_history_overrides_estimate():
+    scheduler = LatencyScheduler(_questions(), num_judges=3, history={"CAB-0001": 600.0})
+    assert _drain(scheduler) == [0, 2, 1]
+
+def test_observed_latency_rescales_mode():
+    questions = _questions()
+    scheduler = LatencyScheduler(questions, num_judges=3)
+    before = scheduler.estimate(1)
+    scheduler.observe(2, scheduler.estimate(2) * 3)
+    assert scheduler.estimate(1) == pytest.approx(before * 3)
+
+def test_concurrent_run_covers_every_question():
+    base = _questions()[0]
+    questions = [dict(base, id=f"CAB-01{i:02d}") for i in range(20)]
+    evaluator = CABEvaluator(model_fn=lambda p: "A", verbose=False, max_workers=4,
+                             randomize_options=False)
+    seen = dict(evaluator._run_questions(questions))
+    assert sorted(seen) == list(range(len(questions)))
+    assert all(r["score"] == 1.0 for r in seen.values())
+
+def test_logprob_judging_is_costed_as_one_call():
+    from cab_benchmark.evaluator import CABEvaluator
+    evaluator = CABEvaluator(model_fn=str, verbose=False, num_judges=5, judge_mode="logprob")
+    assert evaluator._dispatch_order(_questions(), None).num_judges == 1
+    evaluator = CABEvaluator(model_fn=str, verbose=False, num_judges=5)
+    assert evaluator._dispatch_order(_questions(), None).num_judges == 5
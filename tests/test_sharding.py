@@ -0,0 +1,185 @@
+"""Tests for sharded evaluation and merge."""
+import hashlib
+import json
+import pytest
+from cab_benchmark.evaluator import CABEvaluator
+from cab_benchmark.scorer import SubjectiveScorer
+from cab_benchmark.sharding import merge_shards, parse_shard, select_shard, shard_of
+
+def _questions(n):
+    return [{"id": f"CAB-{i:04d}", "dimension": "Apologetics", "tradition": "Baptist",
+             "scoring_mode": "objective"} for i in range(n)]
+
+def _shard_output(questions, index, count):
+    selected, positions = select_shard(questions, index, count)
+    results = [dict(q, score=float(int(q["id"][-1]) % 2)) for q in selected]
+    return {
+        "metadata": {"dataset_version": "2.0", "timestamp": f"2026-02-0{index + 1}",
+                     "total_questions": len(selected), "filters": {}, "model": "m", "seed": 1,
+                     "shard": {"index": index, "count": count, "positions": positions}},
+        "summary": {},
+        "detailed_results": results,
+    }
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
+    with pytest.raises(ValueError):
+        parse_shard("4/4")
+    with pytest.raises(ValueError):
+        parse_shard("x")
+
+def test_shards_partition_questions():
+    questions = _questions(200)
+    seen = []
+    for i in range(4):
+        selected, _ = select_shard(questions, i, 4)
+        seen.extend(q["id"] for q in selected)
+    assert sorted(seen) == [q["id"] for q in questions]
+    assert shard_of("CAB-0042", 4) == shard_of("CAB-0042", 4)
+
+def test_merge_restores_order():
+    questions = _questions(50)
+    partials = [_shard_output(questions, i, 3) for i in (2, 0, 1)]
+    merged = merge_shards(partials)
+    assert [r["id"] for r in merged["detailed_results"]] == [q["id"] for q in questions]
+    assert merged["summary"]["total_questions"] == 50
+    assert merged["metadata"]["timestamp"] == "2026-02-03"
+    assert "shard" not in merged["metadata"]
+
+def test_merge_rejects_missing_shard():
+    questions = _questions(10)
+    with pytest.raises(ValueError):
+        merge_shards([_shard_output(questions, 0, 3), _shard_output(questions, 1, 3)])
+
+def test_merge_sums_hedging_reports():
+    questions = _questions(20)
+    partials = [_shard_output(questions, i, 2) for i in range(2)]
+    for i, partial in enumerate(partials):
+        partial["metadata"]["hedging"] = {
+            "percentile": 0.95, "budget": 0.05,
+            "calls": {"model": 10 * (i + 1)}, "hedges": {"model": i + 1}, "hedge_wins": {"model": 1},
+            "hedge_rate": (i + 1) / (10 * (i + 1)), "thresholds": {"model": 0.1 * (i + 1)},
+            "latency_saved": 0.5,
+        }
+    hedging = merge_shards(partials)["metadata"]["hedging"]
+    assert hedging["calls"] == {"model": 30}
+    assert hedging["hedges"] == {"model": 3}
+    assert hedging["hedge_wins"] == {"model": 2}
+    assert hedging["hedge_rate"] == pytest.approx(0.1)
+    assert hedging["latency_saved"] == pytest.approx(1.0)
+    assert hedging["shard_thresholds"] == [{"model": 0.1}, {"model": 0.2}]
+
+def test_merge_rejects_mixed_administrations():
+    questions = _questions(20)
+    partials = [_shard_output(questions, i, 2) for i in range(2)]
+    partials[0]["metadata"]["administrations"] = 3
+    with pytest.raises(ValueError, match="administrations"):
+        merge_shards(partials)
+
+def test_merge_combines_incremental_records():
+    questions = _questions(30)
+    partials = [_shard_output(questions, i, 2) for i in range(2)]
+    for partial in partials:
+        ids = [r["id"] for r in partial["detailed_results"]]
+        partial["metadata"]["incremental"] = {
+            "prior_results": "v1.jsonl",
+            "carried_over": [i for i in ids if int(i[-1]) % 3],
+            "recomputed": [i for i in ids if not int(i[-1]) % 3],
+        }
+    incremental = merge_shards(partials)["metadata"]["incremental"]
+    ids = [q["id"] for q in questions]
+    assert incremental["prior_results"] == "v1.jsonl"
+    assert incremental["carried_over"] == [i for i in ids if int(i[-1]) % 3]
+    assert incremental["recomputed"] == [i for i in ids if not int(i[-1]) % 3]
+
+    del partials[1]["metadata"]["incremental"]
+    with pytest.raises(ValueError, match="incremental"):
+        merge_shards(partials)
+
+def test_merge_rejects_mixed_judge_modes():
+    questions = _questions(20)
+    partials = [_shard_output(questions, i, 2) for i in range(2)]
+    partials[0]["metadata"]["judge_mode"] = "panel"
+    partials[1]["metadata"]["judge_mode"] = "logprob"
+    with pytest.raises(ValueError, match="judge_mode"):
+        merge_shards(partials)
+
+def test_merge_rejects_mixed_judges():
+    questions = _questions(20)
+    partials = [_shard_output(questions, i, 2) for i in range(2)]
+    partials[0]["metadata"]["judge"] = {"model": "a", "num_judges": 3}
+    partials[1]["metadata"]["judge"] = {"model": "b", "num_judges": 5}
+    with pytest.raises(ValueError, match="'judge'"):
+        merge_shards(partials)
+
+def _dataset(tmp_path, n=24):
+    questions = []
+    for i in range(n):
+        q = {"id": f"CAB-{i:04d}", "dimension": ["Apologetics", "Church History"][i % 2],
+             "tradition": "Baptist", "difficulty": "L2"}
+        if i % 3:
+            q.update(scoring_mode="objective", question=f"Question {i}?",
+                     options=[f"{c}) option {c}{i}" for c in "ABCD"], correct_answer="ABCD"[i % 4])
+        else:
+            q.update(scoring_mode="subjective", scenario=f"Scenario {i}", rubric_focus="Care")
+        questions.append(q)
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"version": "test", "questions": questions}))
+    return str(path)
+
+class HashJudge(SubjectiveScorer):
+    """Judge whose score is a fixed function of the prompt."""
+
+    def _call_judge(self, prompt):
+        return f"SCORE: {hashlib.sha256(prompt.encode()).digest()[0] % 5 + 1}"
+
+def _evaluator(seed=7):
+    # The answer depends on the presented option order, so shuffles must agree
+    model = lambda prompt: "ABCD"[hashlib.sha256(prompt.encode()).digest()[0] % 4]
+    evaluator = CABEvaluator(model_fn=model, verbose=False, seed=seed, model_name="m")
+    evaluator.subjective_scorer = HashJudge(judge_client=None)
+    return evaluator
+
+def _comparable(output):
+    results = []
+    for r in output["detailed_results"]:
+        r = dict(r, details={k: v for k, v in r["details"].items() if k != "timing"})
+        results.append(r)
+    summary = {k: v for k, v in output["summary"].items() if k != "performance"}
+    return results, summary
+
+def test_sharded_evaluate_matches_single_run(tmp_path):
+    dataset = _dataset(tmp_path)
+    single = _evaluator().evaluate(dataset)
+    partials = [_evaluator().evaluate(dataset, shard=(i, 3)) for i in range(3)]
+    merged = merge_shards(partials)
+    assert _comparable(merged) == _comparable(single)
+    assert merged["summary"]["performance"]["questions"] == single["summary"]["performance"]["questions"]
+
+def test_unseeded_shards_are_rejected(tmp_path):
+    dataset = _dataset(tmp_path)
+    with pytest.raises(ValueError, match="seed"):
+        _evaluator(seed=None).evaluate(dataset, shard=(0, 2))
+    partials = [_shard_output(_questions(10), i, 2) for i in range(2)]
+    for partial in partials:
+        partial["metadata"]["seed"] = None
+    with pytest.raises(ValueError, match="seed"):
+        merge_shards(partials)
+
+def test_sharded_incremental_evaluate_matches_single_run(tmp_path):
+    prior = _evaluator().evaluate(_dataset(tmp_path))
+    data = json.loads((tmp_path / "data.json").read_text())
+    for q in data["questions"][::4]:
+        q["question" if q["scoring_mode"] == "objective" else "scenario"] += " (revised)"
+    (tmp_path / "data.json").write_text(json.dumps(data))
+    dataset = str(tmp_path / "data.json")
+
+    single = _evaluator().evaluate(dataset, prior_results=prior)
+    partials = [_evaluator().evaluate(dataset, prior_results=prior, shard=(i, 3)) for i in range(3)]
+    merged = merge_shards(partials)
+    assert _comparable(merged) == _comparable(single)
+    assert merged["metadata"]["incremental"] == single["metadata"]["incremental"]
+    # Only recomputed questions contribute timings
+    recomputed = len(single["metadata"]["incremental"]["recomputed"])
+    assert merged["summary"]["performance"]["questions"] == recomputed
+    assert single["summary"]["performance"]["questions"] == recomputed
@@ -0,0 +1,46 @@
+"""Tests for paired significance testing."""
+import pytest
+from cab_benchmark.aggregator import compare_models
+from cab_benchmark.significance import build_score_matrix, significance_tests
+
+def _results(scores, dims=("Pastoral Care", "Apologetics")):
+    return [
+        {"id": f"CAB-{i:04d}", "dimension": dims[i % len(dims)], "score": s}
+        for i, s in enumerate(scores)
+    ]
+
+def test_build_score_matrix_uses_shared_questions():
+    names, ids, _, scores = build_score_matrix({
+        "a": _results([1.0, 0.0, 1.0]),
+        "b": _results([0.0, 1.0]),
+    })
+    assert names == ["a", "b"]
+    assert ids == ["CAB-0000", "CAB-0001"]
+    assert scores.shape == (2, 2)
+
+def test_clear_difference_is_significant():
+    out = significance_tests({
+        "strong": _results([1.0] * 200),
+        "weak": _results([0.0, 1.0] * 100),
+    }, n_permutations=2000, n_bootstrap=2000)
+    pair = out["overall"]["pairs"][0]
+    assert pair["mean_diff"] == pytest.approx(0.5)
+    assert pair["permutation_p"] < 0.01
+    assert pair["bootstrap_p"] < 0.01
+    assert out["overall"]["rank_confidence"]["strong"]["rank_ci"] == [1, 1]
+    assert set(out["by_dimension"]) == {"Pastoral Care", "Apologetics"}
+
+def test_identical_models_not_significant():
+    scores = [1.0, 0.0, 0.5, 0.75] * 25
+    out = significance_tests({"a": _results(scores), "b": _results(scores)},
+                             n_permutations=500, n_bootstrap=500, by_dimension=False)
+    assert out["overall"]["pairs"][0]["permutation_p"] == pytest.approx(1.0)
+
+def test_compare_models_attaches_significance():
+    comparison = compare_models(
+        {"a": {"cab_score": 0.8}, "b": {"cab_score": 0.6}},
+        detailed_results={"a": _results([1.0] * 20), "b": _results([0.0] * 20)},
+        n_permutations=200, n_bootstrap=200,
+    )
+    assert comparison["overall_ranking"][0][0] == "a"
+    assert "significance" in comparison
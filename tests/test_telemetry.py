@@ -0,0 +1,70 @@
+"""Tests for timing and token instrumentation."""
+import json
+import pytest
+from cab_benchmark.telemetry import (
+    QuestionTrace, call_with_retries, export_prometheus, export_trace, summarize_timings,
+)
+
+def _result(qid):
+    trace = QuestionTrace()
+    with trace.span("model"):
+        pass
+    with trace.span("judge", judge=0):
+        pass
+    trace.add_tokens("model", {"input_tokens": 10, "output_tokens": 2})
+    trace.add_tokens("judge", {"input_tokens": 100, "output_tokens": 20})
+    return {"id": qid, "scoring_mode": "subjective", "details": {"timing": trace.to_dict()}}
+
+def test_retries_are_counted():
+    calls = []
+    def flaky(prompt):
+        calls.append(prompt)
+        if len(calls) < 3:
+            raise RuntimeError("transient")
+        return "ok"
+    trace = QuestionTrace()
+    assert call_with_retries(flaky, "p", trace, max_retries=2, backoff=0) == "ok"
+    assert trace.retries == 2
+    with pytest.raises(ZeroDivisionError):
+        call_with_retries(lambda p: 1 / 0, "p", trace, max_retries=0)
+
+def test_summarize_timings():
+    perf = summarize_timings([_result("CAB-0001"), _result("CAB-0002")])
+    assert perf["questions"] == 2
+    assert perf["stages"]["judge"]["count"] == 2
+    assert perf["tokens"]["judge"] == {"input": 200, "output": 40}
+
+def test_exports(tmp_path):
+    results = [_result("CAB-0001")]
+    output = {"metadata": {"model": "m"}, "summary": {"performance": summarize_timings(results)},
+              "detailed_results": results}
+    export_prometheus(output, tmp_path / "metrics.prom")
+    text = (tmp_path / "metrics.prom").read_text()
+    assert 'cab_tokens_total{model="m",role="judge",direction="input"} 100' in text
+    export_trace(output, tmp_path / "trace.json")
+    spans = json.loads((tmp_path / "trace.json").read_text())["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [s["name"] for s in spans] == ["question CAB-0001", "model", "judge"]
+
+def test_judge_override_point_and_usage():
+    from types import SimpleNamespace
+    from cab_benchmark.scorer import AnthropicSubjectiveScorer
+    question = {"scenario": "S", "rubric_focus": "R", "tradition": "Catholic"}
+
+    class Custom(AnthropicSubjectiveScorer):
+        def _call_judge(self, prompt):
+            return "SCORE: 5\nJUSTIFICATION: Good."
+
+    trace = QuestionTrace()
+    score, details = Custom(judge_client=None).score(question, "answer", trace=trace)
+    assert details["raw_scores"] == [5, 5, 5]
+    assert trace.tokens == {}
+
+    reply = SimpleNamespace(
+        content=[SimpleNamespace(text="SCORE: 2\nJUSTIFICATION: Weak.")],
+        usage=SimpleNamespace(input_tokens=10, output_tokens=3),
+    )
+    client = SimpleNamespace(messages=SimpleNamespace(create=lambda **kwargs: reply))
+    trace = QuestionTrace()
+    _, details = AnthropicSubjectiveScorer(judge_client=client).score(question, "answer", trace=trace)
+    assert details["raw_scores"] == [2, 2, 2]
+    assert trace.tokens == {"judge": {"input": 30, "output": 9}}
@@ -0,0 +1,40 @@
+"""Tests for the results warehouse."""
+import json
+import pytest
+from cab_benchmark.warehouse import ResultsWarehouse
+
+def _run(scores):
+    return {
+        "metadata": {"timestamp": "2026-02-01T00:00:00", "dataset_version": "2.0"},
+        "summary": {"total_questions": len(scores), "cab_score": 0.5},
+        "detailed_results": [
+            {"id": f"CAB-{i:04d}", "dimension": "Pastoral Care",
+             "tradition": "Catholic" if i % 2 else "Cross-Tradition",
+             "difficulty": "L1", "scoring_mode": "subjective", "score": s,
+             "details": {"raw_scores": [3, 4, 4]}}
+            for i, s in enumerate(scores)
+        ],
+    }
+
+def test_ingest_and_query(tmp_path):
+    path = tmp_path / "run.json"
+    path.write_text(json.dumps(_run([0.5, 1.0, 0.25, 0.75])))
+    with ResultsWarehouse(tmp_path / "cab.db") as wh:
+        wh.ingest(path, model="m1")
+        wh.ingest(path, model="m1")  # re-ingest replaces the earlier run
+        assert len(wh.runs()) == 1
+        rows = wh.query(tradition=["Catholic"], include_details=True)
+        assert [r["question_id"] for r in rows] == ["CAB-0001", "CAB-0003"]
+        assert rows[0]["details"]["raw_scores"] == [3, 4, 4]
+
+def test_summarize_groups(tmp_path):
+    with ResultsWarehouse(tmp_path / "cab.db") as wh:
+        wh.ingest_run(_run([1.0, 0.0]), model="m1")
+        wh.ingest_run(_run([0.5, 0.5]), model="m2")
+        rows = wh.summarize(["model"], dimension=["Pastoral Care"])
+        assert [(r["model"], r["mean_score"], r["count"]) for r in rows] == [
+            ("m1", 0.5, 2), ("m2", 0.5, 2)
+        ]
+        assert wh.summarize(["model"], since="2027-01-01") == []
+        with pytest.raises(ValueError):
+            wh.summarize(["score"])